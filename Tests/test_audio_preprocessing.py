@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+torch = pytest.importorskip("torch")
+
+from core import audio_preprocessing  # noqa: E402
+from core.audio_preprocessing import (  # noqa: E402
+    VAD_WINDOW_SIZE,
+    _load_mono,
+    _save_pcm16,
+    _speech_timestamps_from_probs,
+)
+
+# The module imports torch on first use; the helpers below need it bound
+audio_preprocessing._import_torch()
+
+CONFIG = {
+    "threshold": 0.5,
+    "min_speech_duration_ms": 250,  # 4000 samples, about 8 windows
+    "max_speech_duration_s": 30,
+    "min_silence_duration_ms": 100,  # 1600 samples, about 3 windows
+    "speech_pad_ms": 0,
+}
+
+
+def make_probs(num_windows: int, runs: list[tuple[int, int]], value: float = 0.9):
+    probs = torch.full((num_windows,), 0.05)
+    for start, end in runs:
+        probs[start:end] = value
+    return probs
+
+
+def timestamps(probs, config=CONFIG):
+    return _speech_timestamps_from_probs(probs, probs.numel() * VAD_WINDOW_SIZE, config)
+
+
+def test_silence_has_no_speech():
+    assert timestamps(make_probs(100, [])) == []
+    assert timestamps(torch.zeros(0)) == []
+
+
+def test_single_run_maps_to_samples():
+    assert timestamps(make_probs(100, [(10, 30)])) == [
+        {"start": 10 * VAD_WINDOW_SIZE, "end": 30 * VAD_WINDOW_SIZE}
+    ]
+
+
+def test_hysteresis_holds_speech_between_thresholds():
+    probs = make_probs(100, [(10, 30)])
+    # Below threshold but above threshold - 0.15: speech continues
+    probs[18:22] = 0.45
+    assert timestamps(probs) == [
+        {"start": 10 * VAD_WINDOW_SIZE, "end": 30 * VAD_WINDOW_SIZE}
+    ]
+
+
+def test_short_silence_is_merged():
+    # 2 windows (1024 samples) of silence is below min_silence
+    assert timestamps(make_probs(100, [(10, 30), (32, 50)])) == [
+        {"start": 10 * VAD_WINDOW_SIZE, "end": 50 * VAD_WINDOW_SIZE}
+    ]
+
+
+def test_long_silence_splits_segments():
+    assert timestamps(make_probs(100, [(10, 30), (40, 60)])) == [
+        {"start": 10 * VAD_WINDOW_SIZE, "end": 30 * VAD_WINDOW_SIZE},
+        {"start": 40 * VAD_WINDOW_SIZE, "end": 60 * VAD_WINDOW_SIZE},
+    ]
+
+
+def test_short_speech_is_dropped():
+    assert timestamps(make_probs(100, [(10, 13), (40, 60)])) == [
+        {"start": 40 * VAD_WINDOW_SIZE, "end": 60 * VAD_WINDOW_SIZE}
+    ]
+
+
+def test_long_speech_is_split_evenly():
+    config = dict(CONFIG, max_speech_duration_s=1)
+    result = timestamps(make_probs(100, [(10, 70)]), config)
+    assert len(result) == 2
+    assert result[0]["start"] == 10 * VAD_WINDOW_SIZE
+    assert result[-1]["end"] == 70 * VAD_WINDOW_SIZE
+    assert result[0]["end"] == result[1]["start"]
+    assert all(r["end"] - r["start"] <= 16000 for r in result)
+
+
+def test_padding_is_clamped_and_shares_short_gaps():
+    config = dict(CONFIG, speech_pad_ms=100)  # 1600 samples
+    result = timestamps(make_probs(100, [(1, 20), (25, 99)]), config)
+    gap = 5 * VAD_WINDOW_SIZE  # Shorter than two pads: split in half
+    assert result == [
+        {"start": 0, "end": 20 * VAD_WINDOW_SIZE + gap // 2},
+        {"start": 25 * VAD_WINDOW_SIZE - gap // 2, "end": 100 * VAD_WINDOW_SIZE},
+    ]
+
+
+def test_load_mono_keeps_the_sample_rate(tmp_path):
+    path = tmp_path / "stereo.wav"
+    left = np.linspace(-0.5, 0.5, 8000, dtype=np.float32)
+    sf.write(path, np.stack([left, np.zeros_like(left)], axis=1), 8000)
+    waveform, sample_rate = _load_mono(str(path))
+    assert sample_rate == 8000
+    assert waveform.shape == (1, 8000)
+    assert torch.allclose(waveform[0], torch.from_numpy(left) / 2, atol=1e-4)
+
+
+def test_save_pcm16_writes_16_bit_wav(tmp_path):
+    path = tmp_path / "out.wav"
+    waveform = torch.tensor([[0.0, 0.5, 2.0], [0.0, -0.5, -2.0]])
+    _save_pcm16(str(path), waveform, 16000)
+    info = sf.info(str(path))
+    assert (info.subtype, info.channels, info.samplerate) == ("PCM_16", 2, 16000)
+    data, _ = sf.read(str(path), dtype="float32")
+    assert data[2].tolist() == pytest.approx([1.0, -1.0], abs=1e-4)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import pytest
+
+from core import batch_transcription
+from core.batch_transcription import (
+    MAX_BATCH_SIZE,
+    BatchTranscriptionThread,
+    RateLimitedEmitter,
+    _speech_clips,
+    compute_batch_size,
+)
+
+
+class FakeSignal:
+    def __init__(self) -> None:
+        self.emitted: list = []
+
+    def emit(self, payload) -> None:
+        self.emitted.append(payload)
+
+
+def test_compute_batch_size_manual_returns_user_value():
+    assert compute_batch_size(64.0, 100, False, 5, "small") == 5
+
+
+def test_compute_batch_size_is_clamped():
+    assert compute_batch_size(1024.0, 100, True, 8, "tiny") == MAX_BATCH_SIZE
+    assert compute_batch_size(1024.0, 3, True, 8, "tiny") == 3
+    assert compute_batch_size(0.5, 100, True, 8, "large-v3") == 1
+
+
+def test_compute_batch_size_grows_with_memory_and_shrinks_with_model():
+    assert compute_batch_size(2.0, 100, True, 8, "base") < compute_batch_size(
+        4.0, 100, True, 8, "base"
+    )
+    assert compute_batch_size(4.0, 100, True, 8, "medium") < compute_batch_size(
+        4.0, 100, True, 8, "base"
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(batch_transcription.time, "perf_counter", lambda: now[0])
+    return now
+
+
+def test_rate_limited_emitter_keeps_latest_payload(clock):
+    signal = FakeSignal()
+    emitter = RateLimitedEmitter(signal, interval=1.0)
+    emitter.emit(1)
+    emitter.emit(2)
+    emitter.emit(3)
+    assert signal.emitted == [1]
+    clock[0] += 1.0
+    emitter.emit(4)
+    assert signal.emitted == [1, 4]
+
+
+def test_rate_limited_emitter_combines_and_flushes(clock):
+    signal = FakeSignal()
+    emitter = RateLimitedEmitter(signal, interval=1.0, combine="\n".join)
+    emitter.emit("a")
+    emitter.emit("b")
+    emitter.emit("c")
+    emitter.flush()
+    emitter.flush()
+    assert signal.emitted == ["a", "b\nc"]
+
+
+def test_speech_clips_group_chunks_up_to_the_pipeline_chunk():
+    rate = batch_transcription.SAMPLING_RATE
+    chunks = [
+        {"start": 0, "end": 20 * rate},
+        {"start": 25 * rate, "end": 40 * rate},
+        {"start": 50 * rate, "end": 52 * rate},
+    ]
+    assert _speech_clips(chunks) == [
+        {"start": 0.0, "end": 20.0},
+        {"start": 20.0, "end": 37.0},
+    ]
+    assert _speech_clips(chunks, offset=10.0)[0] == {"start": 10.0, "end": 30.0}
+
+
+@pytest.fixture
+def make_thread(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    threads = []
+
+    def factory(**settings):
+        base = {"model_size": "small", "device": "cpu", "compute_type": "int8"}
+        thread = BatchTranscriptionThread([], {**base, **settings})
+        threads.append(thread)
+        return thread
+
+    yield factory
+    for thread in threads:
+        thread._stop_writer()
+
+
+def test_cache_key_follows_content_not_path(tmp_path, make_thread):
+    first = tmp_path / "a.wav"
+    copy = tmp_path / "b.wav"
+    other = tmp_path / "c.wav"
+    first.write_bytes(b"audio")
+    copy.write_bytes(b"audio")
+    other.write_bytes(b"other")
+    thread = make_thread()
+    key = thread._transcription_cache_key(str(first))
+    assert key == thread._transcription_cache_key(str(copy))
+    assert key != thread._transcription_cache_key(str(other))
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"model_size": "medium"},
+        {"compute_type": "float32"},
+        {"language": "en"},
+        {"initial_prompt": "Ata da reunião"},
+        {"best_of": 5},
+        {"condition_on_previous_text": True},
+    ],
+)
+def test_cache_key_changes_with_output_settings(tmp_path, make_thread, change):
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"audio")
+    assert make_thread()._transcription_cache_key(str(audio)) != make_thread(
+        **change
+    )._transcription_cache_key(str(audio))
+
+
+def test_stream_result_sums_audio_duration_from_info(make_thread):
+    thread = make_thread()
+    for name, info in (("a.wav", {"duration": 12.5}), ("b.wav", None)):
+        thread._stream_result(
+            {"file_path": name, "success": True, "processing_time": 1.0, "info": info}
+        )
+    thread._stream_result({"file_path": "c.wav", "success": False, "error": "x"})
+    context = thread._build_report_context(10.0, include_transcriptions=False)
+    assert context["total_duration"] == 12.5
+    assert (context["n_success"], context["n_failed"]) == (2, 1)
+
+
+def test_construction_does_not_import_or_probe(monkeypatch, make_thread):
+    def fail():
+        raise AssertionError("called on the GUI thread")
+
+    monkeypatch.setattr(batch_transcription, "_lazy_imports", fail)
+    monkeypatch.setattr(batch_transcription, "_cuda_available", fail)
+    make_thread(device="auto", compute_type="auto")
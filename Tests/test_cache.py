@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+
+from core import cache as cache_module
+from core.cache import FileCache, IntelligentModelCache
+
+
+def rows(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def test_durations_are_appended_and_reloaded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"audio")
+    file_cache = FileCache()
+    file_cache.set_duration(str(audio), 1.0)
+    file_cache.set_duration(str(audio), 2.0)
+    assert len(rows(tmp_path / ".vox_file_cache.ndjson")) == 2
+
+    reloaded = FileCache()
+    assert reloaded.get_duration(str(audio)) == 2.0
+
+
+def test_flush_compacts_superseded_rows(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"audio")
+    file_cache = FileCache()
+    for duration in (1.0, 2.0, 3.0):
+        file_cache.set_duration(str(audio), duration)
+    file_cache.flush()
+    log = rows(tmp_path / ".vox_file_cache.ndjson")
+    assert [row["duration"] for row in log] == [3.0]
+
+
+def test_truncated_row_is_skipped_and_compacted(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"audio")
+    FileCache().set_duration(str(audio), 1.0)
+    log = tmp_path / ".vox_file_cache.ndjson"
+    with open(log, "a", encoding="utf-8") as f:
+        f.write('{"filepath": "b.wav", "dur')
+
+    reloaded = FileCache()
+    assert reloaded.get_duration(str(audio)) == 1.0
+    assert len(rows(log)) == 1
+
+
+def test_legacy_json_cache_is_migrated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    entry = {
+        "filepath": "a.wav",
+        "duration": 4.0,
+        "size": 5,
+        "mtime": 0.0,
+        "cached_at": 0.0,
+    }
+    (tmp_path / ".vox_file_cache.json").write_text(json.dumps({"a.wav": entry}))
+    (tmp_path / ".vox_transcription_cache.json").write_text(
+        json.dumps({"key": {"transcription": "olá"}})
+    )
+
+    file_cache = FileCache()
+    assert file_cache.cache["a.wav"].duration == 4.0
+    assert file_cache.get_transcription("key") == {"transcription": "olá"}
+    assert not (tmp_path / ".vox_file_cache.json").exists()
+    assert not (tmp_path / ".vox_transcription_cache.json").exists()
+    assert rows(tmp_path / ".vox_file_cache.ndjson") == [entry]
+
+
+def test_transcription_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache_module, "TRANSCRIPTION_CACHE_MAX_ENTRIES", 3)
+    file_cache = FileCache()
+    for key in "abcdefg":
+        file_cache.set_transcription(key, {"transcription": key})
+    assert list(file_cache.transcriptions) == ["e", "f", "g"]
+    # Compacted once the log outgrew twice the bound
+    assert len(rows(tmp_path / ".vox_transcription_cache.ndjson")) <= 6
+
+    reloaded = FileCache()
+    assert list(reloaded.transcriptions) == ["e", "f", "g"]
+    assert reloaded.get_transcription("a") is None
+
+
+def test_model_cache_info_accepts_null_fields(tmp_path):
+    info = {
+        "model_key": "k",
+        "model_size": "base",
+        "device": "cpu",
+        "compute_type": None,
+        "cache_path": "",
+        "memory_usage_mb": 0,
+        "load_time": 0,
+        "cached_at": 0,
+        "last_accessed": 0,
+        "access_count": 1,
+    }
+    (tmp_path / "cache_info.json").write_text(json.dumps({"k": info}))
+    model_cache = IntelligentModelCache(cache_dir=str(tmp_path))
+    assert model_cache._cache_info["k"].compute_type is None
+    assert model_cache._cache_info["k"].model_size == "base"
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+
+from core.config import _DEFAULT_SETTINGS, ConfigManager
+
+
+def test_missing_file_uses_defaults(tmp_path):
+    manager = ConfigManager(str(tmp_path / "config.json"))
+    assert manager.settings == dict(_DEFAULT_SETTINGS)
+
+
+def test_file_values_override_defaults(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"language": "en", "custom": 1}))
+    manager = ConfigManager(str(path))
+    assert manager.get("language") == "en"
+    assert manager.get("custom") == 1
+    assert manager.get("model_size") == _DEFAULT_SETTINGS["model_size"]
+
+
+def test_save_writes_only_when_changed(tmp_path):
+    path = tmp_path / "config.json"
+    ConfigManager(str(path)).save_settings()
+    mtime = path.stat().st_mtime_ns
+
+    manager = ConfigManager(str(path))
+    manager.save_settings()
+    assert path.stat().st_mtime_ns == mtime
+
+    manager.set("language", "en")
+    manager.save_settings()
+    assert json.loads(path.read_text())["language"] == "en"
+    assert not (tmp_path / "config.json.tmp").exists()
+
+
+def test_save_completes_file_missing_defaults(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"language": "en"}))
+    ConfigManager(str(path)).save_settings()
+    saved = json.loads(path.read_text())
+    assert saved["language"] == "en"
+    assert saved.keys() == _DEFAULT_SETTINGS.keys()
@@ -4,24 +4,465 @@ This module implements high-performance batch processing for audio transcription
 achieving 8-12x speed improvements over sequential processing.
 """
 
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import logging
+import mmap
+import multiprocessing as mp
 import os
+import queue
+import re
+import tempfile
+import threading
 import time
-import logging
-from typing import List, Dict, Any, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
+import numpy as np
 import psutil
-from faster_whisper import WhisperModel, BatchedInferencePipeline
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from .performance import get_optimal_threading_config, get_hardware_info
 from .cache import FileCache
-from .reporting import SystemProfiler, PerformanceMonitor, TimestampManager, EnhancedReportGenerator
+from .performance import get_hardware_info, get_optimal_threading_config
+from .reporting import (
+    EnhancedReportGenerator,
+    PerformanceMonitor,
+    SystemProfiler,
+    TimestampManager,
+)
+
+if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+    from faster_whisper.vad import (
+        SpeechTimestampsMap,
+        VadOptions,
+        get_speech_timestamps,
+    )
+else:
+    # faster_whisper (CTranslate2 and PyAV behind it) is imported on first use
+    # (see _lazy_imports) so importing the application does not pay for it up front.
+    # numpy and psutil stay eager: the performance and UI modules import them anyway.
+    WhisperModel = None
+    BatchedInferencePipeline = None
+    decode_audio = None
+    VadOptions = None
+    get_speech_timestamps = None
+    SpeechTimestampsMap = None
+_faster_whisper_loaded = False
+
+
+def _physical_core_count() -> int:
+    """Physical cores usable by this process (no SMT siblings, affinity respected)."""
+    cores = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        cores = min(cores, len(os.sched_getaffinity(0)))
+    return max(1, cores)
+
+
+def _configure_openmp_environment() -> None:
+    """Pin OpenMP/MKL threads to physical cores; must run before CTranslate2 is loaded.
+    
+    Uses setdefault so explicit user/environment settings still win.
+    """
+    cores = str(_physical_core_count())
+    os.environ.setdefault("OMP_NUM_THREADS", cores)
+    os.environ.setdefault("MKL_NUM_THREADS", cores)
+    os.environ.setdefault("OMP_PROC_BIND", "close")
+    os.environ.setdefault("OMP_PLACES", "cores")
+
+
+def _lazy_imports() -> None:
+    """Import faster_whisper once, on first use, after the OpenMP environment is set."""
+    global WhisperModel, BatchedInferencePipeline, decode_audio
+    global VadOptions, get_speech_timestamps, SpeechTimestampsMap
+    global _faster_whisper_loaded
+    if _faster_whisper_loaded:
+        return
+    
+    _configure_openmp_environment()
+    from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+    from faster_whisper.vad import (
+        SpeechTimestampsMap,
+        VadOptions,
+        get_speech_timestamps,
+    )
+    _faster_whisper_loaded = True  # Set last, once every name above is bound
 
 
 logger = logging.getLogger(__name__)
 
+SAMPLING_RATE = 16000
+PIPELINE_CHUNK_LENGTH = 30  # Seconds per pipeline chunk, as recommended for Whisper
+BATCH_VAD_PAD_MS = 200  # Padding kept around each speech region by the batch-level VAD
+SOUNDFILE_EXTENSIONS = (".wav", ".flac", ".ogg")  # Read by libsndfile without a demuxer
+
+# Seconds; batches never mix files across these edges
+DURATION_BUCKET_EDGES = (30, 120, 600)
+# Minimum seconds between progress signals sent to the UI thread
+PROGRESS_EMIT_INTERVAL = 0.25
+# Temporary files left by chunking/acceleration: *_chunk_* (incl. ffmpeg/silence
+# chunks), *_accelerated*, *_processed* and *_extracted* WAVs. Case-insensitive on
+# Windows, like glob.
+_CLEANUP_RE = re.compile(r".*(_chunk_|_accelerated|_processed|_extracted).*\.wav$",
+                         re.IGNORECASE if os.name == "nt" else 0)
+REPORT_PREVIEW_CHARS = 4096  # Report text sent inline with the completion data
+
+# Short files are packed together into one 30 s window so each encoder chunk is
+# mostly speech
+SHORT_FILE_MAX_SECONDS = 15
+PACK_MAX_SECONDS = 30
+PACK_GAP_SECONDS = 0.5
+
+# Approximate int8 weight size (MB) and per-sample activation footprint (MB) of one
+# 30 s decoding window, per Whisper model family.
+MODEL_WEIGHT_MB = {"tiny": 40, "base": 75, "small": 245, "medium": 770, "large": 1550}
+MODEL_ACTIVATION_MB = {"tiny": 40, "base": 80, "small": 200, "medium": 500,
+                       "large": 1200}
+BATCH_MEMORY_FRACTION = 0.5  # Share of system memory the batched pipeline may use
+MAX_BATCH_SIZE = 32
+
+# Below batch 32 a single small-model instance cannot saturate a many-core CPU; on such
+# machines files are transcribed in spawned worker processes with a few threads each.
+PROCESS_POOL_MIN_CORES = 16
+PROCESS_POOL_MODEL_FAMILIES = ("tiny", "base", "small")
+PROCESS_POOL_THREADS_PER_WORKER = 4
+
+
+class SegmentSpan(NamedTuple):
+    """Lightweight stand-in for a faster_whisper Segment retained in results."""
+    start: float
+    end: float
+    text: str
+
+
+# Process-wide caches: loading Whisper weights dominates run start-up, so models and
+# pipelines are shared across BatchTranscriptionThread instances.
+_MODEL_CACHE: Dict[Tuple, WhisperModel] = {}
+_PIPELINE_CACHE: Dict[Tuple, BatchedInferencePipeline] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _model_cache_key(model_settings: Dict[str, Any]) -> Tuple:
+    """Cache key of a model: (model_size, device, compute_type, cpu_threads)."""
+    return (
+        model_settings.get("model_size_or_path"),
+        model_settings.get("device"),
+        model_settings.get("compute_type"),
+        model_settings.get("cpu_threads"),
+    )
+
+
+def _get_cached_model(model_key: Tuple, model_settings: Dict[str, Any]) -> WhisperModel:
+    """Return the process-wide model for ``model_key``, loading it on first use."""
+    _lazy_imports()
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(model_key)
+        if model is not None:
+            logger.info(f"Reusing cached model: {model_settings}")
+            return model
+        
+        model = WhisperModel(**model_settings)
+        _MODEL_CACHE[model_key] = model
+    logger.info(f"Created optimized model: {model_settings}")
+    return model
+
+
+def evict_model_cache() -> None:
+    """Drop all cached Whisper models and pipelines (e.g. on application shutdown)."""
+    with _MODEL_CACHE_LOCK:
+        _PIPELINE_CACHE.clear()
+        _MODEL_CACHE.clear()
+    logger.info("Whisper model cache evicted")
+
+
+def load_audio_array(file_path: str) -> np.ndarray:
+    """Load a file as 16 kHz mono float32 for ``transcribe(audio=...)``.
+    
+    WAV/FLAC/OGG are read with libsndfile and resampled with a polyphase filter;
+    other containers fall back to faster_whisper's in-process PyAV decoder.
+    """
+    if file_path.lower().endswith(SOUNDFILE_EXTENSIONS):
+        try:
+            import soundfile as sf
+            audio, sample_rate = sf.read(file_path, dtype="float32", always_2d=True)
+            audio = audio.mean(axis=1) if audio.shape[1] > 1 else audio[:, 0]
+            if sample_rate != SAMPLING_RATE:
+                from scipy.signal import resample_poly
+                divisor = np.gcd(sample_rate, SAMPLING_RATE)
+                audio = resample_poly(audio, SAMPLING_RATE // divisor,
+                                      sample_rate // divisor)
+            return np.ascontiguousarray(audio, dtype=np.float32)
+        except Exception as e:
+            logger.debug(f"soundfile could not read {file_path}, using PyAV: {e}")
+    _lazy_imports()
+    # Without split_stereo, decode_audio returns a single mono array
+    return np.asarray(decode_audio(file_path, sampling_rate=SAMPLING_RATE))
+
+
+@lru_cache(maxsize=1)
+def _hardware_profile() -> Tuple[float, int]:
+    """Memory (GB) and physical core count, probed once per process."""
+    hw_info = get_hardware_info()
+    return hw_info["memory_gb"], hw_info["physical_cores"] or 1
+
+
+def _model_family(model_size: str) -> str:
+    """Map a model name (e.g. ``large-v3``, ``distil-medium.en``) to its size family."""
+    name = str(model_size).lower()
+    for family in ("large", "medium", "small", "base", "tiny"):
+        if family in name:
+            return family
+    return "base"
+
+
+@lru_cache(maxsize=8)
+def compute_batch_size(memory_gb: float, n_files: int, auto: bool, user_bs: int,
+                       model_size: str = "base") -> int:
+    """Batch size for the batched pipeline; deterministic for given hardware and inputs.
+    
+    The batch is sized so that model weights plus one activation footprint per sample
+    fit in half of system memory, clamped to [1, MAX_BATCH_SIZE] and the file count.
+    
+    Args:
+        memory_gb: Total system memory in GB
+        n_files: Number of files in the run
+        auto: Whether to derive the batch size from the hardware
+        user_bs: Batch size configured by the user (used when ``auto`` is False)
+        model_size: Whisper model name, used to estimate weight and activation memory
+        
+    Returns:
+        Batch size to use
+    """
+    if not auto:
+        return user_bs
+    
+    family = _model_family(model_size)
+    weight_mb = MODEL_WEIGHT_MB[family]
+    act_mb = MODEL_ACTIVATION_MB[family]
+    budget_mb = memory_gb * 1024 * BATCH_MEMORY_FRACTION
+    
+    optimal_batch = max(1, int((budget_mb - weight_mb) / act_mb))
+    optimal_batch = min(optimal_batch, MAX_BATCH_SIZE)
+    
+    # Ensure we don't exceed the number of files
+    optimal_batch = max(1, min(optimal_batch, n_files))
+    
+    logger.info(
+        f"Determined optimal batch size: {optimal_batch} "
+        f"(Model: {model_size} [{family}], "
+        f"Memory: {memory_gb}GB, Budget: {budget_mb:.0f}MB, Weights: {weight_mb}MB, "
+        f"Activations/sample: {act_mb}MB, Files: {n_files})"
+    )
+    return optimal_batch
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Whether CTranslate2 sees at least one CUDA device. Probed once per process."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception as e:
+        logger.warning(f"Could not probe CUDA devices: {e}")
+        return False
+
+
+def _resolve_device(requested: Optional[str]) -> str:
+    """Turn the configured device ("auto", "cpu", "cuda" or None) into the one used."""
+    if requested in (None, "auto"):
+        return "cuda" if _cuda_available() else "cpu"
+    if requested == "cuda" and not _cuda_available():
+        logger.warning("CUDA requested but no CUDA device is available; using CPU")
+        return "cpu"
+    return requested
+
+
+@lru_cache(maxsize=None)
+def _default_compute_type(device: str = "cpu") -> str:
+    """Pick the fastest compute type supported by CTranslate2 on this device.
+    
+    On CUDA this is float16. On CPU, int8 GEMMs with wider activations (bfloat16 on
+    AVX512-BF16 CPUs, float32 otherwise) give better throughput than pure int8.
+    Probed once per device.
+    """
+    if device == "cuda":
+        preferred = ("float16", "int8_float16")
+    else:
+        preferred = ("int8_bfloat16", "int8_float32", "int8")
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception as e:
+        logger.warning(f"Could not probe CTranslate2 compute types for {device}: {e}")
+        return preferred[0] if device == "cuda" else "int8"
+    
+    for compute_type in preferred:
+        if compute_type in supported:
+            return compute_type
+    return "default"
+
+
+@lru_cache(maxsize=None)
+def _accepted_params(func) -> frozenset:
+    """Parameter names of ``func``; the pipeline API differs across releases."""
+    return frozenset(inspect.signature(func).parameters)
+
+
+_worker_progress_queue = None
+
+
+def _speech_clips(speech_chunks: List[Dict[str, int]],
+                  offset: float = 0.0) -> List[Dict[str, float]]:
+    """Clip timestamps (seconds) for audio made of ``speech_chunks`` laid end to end.
+    
+    Consecutive chunks are grouped into clips of at most PIPELINE_CHUNK_LENGTH seconds,
+    the same grouping the pipeline's own VAD would produce for the trimmed audio.
+    """
+    clips: List[Dict[str, float]] = []
+    position = offset
+    for chunk in speech_chunks:
+        end = position + (chunk["end"] - chunk["start"]) / SAMPLING_RATE
+        if clips and end - clips[-1]["start"] <= PIPELINE_CHUNK_LENGTH:
+            clips[-1]["end"] = end
+        else:
+            clips.append({"start": position, "end": end})
+        position = end
+    return clips
+
+
+def _pin_worker_threads(slot: int, num_workers: int, threads: int) -> None:
+    """Give a pool worker its own CPUs and OpenMP thread count before CTranslate2 loads.
+    
+    Workers inherit the parent's OMP_PROC_BIND/OMP_PLACES; without a separate CPU set
+    each would bind its threads to the same first cores.
+    """
+    # CTranslate2 itself gets the count through the model's cpu_threads argument
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        share = max(1, len(cpus) // num_workers)
+        # Replacement workers reuse the slots of the ones they replace
+        slot %= num_workers
+        os.sched_setaffinity(0, cpus[slot * share:(slot + 1) * share] or cpus)
+    else:
+        # No way to give each worker its own cores: let the OS place the threads
+        os.environ.pop("OMP_PROC_BIND", None)
+        os.environ.pop("OMP_PLACES", None)
+
+
+def _init_inference_worker(progress_queue, worker_counter, num_workers: int,
+                           threads: int) -> None:
+    """Process-pool initializer: pin threads, keep the queue, import faster_whisper.
+    
+    Workers are spawned, not forked, so each starts from a fresh interpreter.
+    """
+    global _worker_progress_queue
+    _worker_progress_queue = progress_queue
+    with worker_counter.get_lock():
+        slot = worker_counter.value
+        worker_counter.value += 1
+    _pin_worker_threads(slot, num_workers, threads)
+    _lazy_imports()
+
+
+def _transcribe_in_worker(file_path: str, model_settings: Dict[str, Any],
+                          transcribe_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Transcribe one file in a pool worker, loading the worker's model lazily.
+    
+    Returns a picklable result; caching and individual files are handled by the parent.
+    """
+    start_time = time.perf_counter()
+    try:
+        model = _get_cached_model(_model_cache_key(model_settings), model_settings)
+        segments, info = model.transcribe(load_audio_array(file_path),
+                                          **transcribe_kwargs)
+        segments_list = [SegmentSpan(seg.start, seg.end, seg.text) for seg in segments]
+        result = {
+            "file_path": file_path,
+            "transcription": " ".join(seg.text for seg in segments_list),
+            "segments": segments_list,
+            "info": {"language": info.language, "duration": info.duration},
+            "processing_time": time.perf_counter() - start_time,
+            "success": True
+        }
+    except Exception as e:
+        result = {
+            "file_path": file_path,
+            "transcription": "",
+            "segments": [],
+            "info": None,
+            "processing_time": 0,
+            "success": False,
+            "error": str(e)
+        }
+    
+    if _worker_progress_queue is not None:
+        _worker_progress_queue.put((file_path, result["processing_time"]))
+    return result
+
+
+class RateLimitedEmitter:
+    """Coalesce emits of a Qt signal to at most one per ``interval`` seconds.
+    
+    Payloads arriving within the interval are buffered: merged with ``combine`` when
+    given (e.g. joining text), otherwise only the latest is kept. Buffered payloads go
+    out on the next emit after the interval or on flush().
+    """
+    
+    def __init__(self, signal, interval: float = PROGRESS_EMIT_INTERVAL, combine=None):
+        self._signal = signal
+        self._interval = interval
+        self._combine = combine
+        self._pending: List[Any] = []
+        self._last_emit = 0.0
+        self._lock = threading.Lock()  # Also used from the process-pool progress reader
+    
+    def emit(self, payload: Any) -> None:
+        with self._lock:
+            self._pending.append(payload)
+            if time.perf_counter() - self._last_emit >= self._interval:
+                self._emit_pending()
+    
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._emit_pending()
+    
+    def _emit_pending(self) -> None:
+        payload = self._combine(self._pending) if self._combine else self._pending[-1]
+        self._pending = []
+        self._last_emit = time.perf_counter()
+        self._signal.emit(payload)
+
+
+class _SequentialPipeline:
+    """Adapter giving a plain WhisperModel the BatchedInferencePipeline call shape."""
+    
+    def __init__(self, model: WhisperModel):
+        self.model = model
+    
+    def transcribe(self, audio, **kwargs):
+        return self.model.transcribe(audio, **kwargs)
+
 
 class BatchTranscriptionThread(QThread):
     """Advanced batch transcription thread with BatchedInferencePipeline support."""
@@ -35,10 +476,27 @@ class BatchTranscriptionThread(QThread):
     def __init__(self, audio_files: List[str], whisper_settings: Dict[str, Any]):
         super().__init__()
         self.audio_files = audio_files
+        # Display names parsed once; progress signals index into these instead of
+        # re-parsing paths
+        self._audio_paths = [Path(p) for p in audio_files]
+        self._audio_names = [p.name for p in self._audio_paths]
+        self._name_by_path = dict(zip(audio_files, self._audio_names))
         self.whisper_settings = whisper_settings.copy()
         self._is_running = True
         self.file_cache = FileCache()
         
+        # Individual transcriptions are written by a background thread, off the
+        # inference path
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_closed = False
+        self._writer.start()
+        
+        # Per-file progress is coalesced so fast runs do not flood the UI event loop
+        self._status_emitter = RateLimitedEmitter(self.update_status)
+        self._transcription_emitter = RateLimitedEmitter(self.update_transcription,
+                                                         combine="\n".join)
+        
         # Store settings for logging (before they get popped)
         self.settings = whisper_settings.copy()
         
@@ -56,10 +514,43 @@ class BatchTranscriptionThread(QThread):
         self.use_batched_inference = self.whisper_settings.pop("use_batched_inference", True)
         self.batch_size = self.whisper_settings.pop("batch_size", 8)
         self.auto_batch_size = self.whisper_settings.pop("auto_batch_size", True)
+        # Newer pipelines take the batch size per transcribe() call, not in __init__
+        self._pipeline_batch_size = self.batch_size
+        
+        # transcribe() arguments, frozen once (read-only) for every file and code path
+        self._transcription_kwargs = MappingProxyType({k: v for k, v in (
+            ("language", self.whisper_settings.get("language")),
+            ("task", "transcribe"),
+            ("beam_size", self.whisper_settings.get("beam_size", 1)),
+            ("best_of", self.whisper_settings.get("best_of", 1)),
+            ("temperature", self.whisper_settings.get("temperature", 0.0)),
+            ("condition_on_previous_text",
+             self.whisper_settings.get("condition_on_previous_text", False)),
+            ("initial_prompt", self.whisper_settings.get("initial_prompt") or None),
+            ("vad_filter", self.whisper_settings.get("vad_filter", True)),
+            ("without_timestamps", False),
+        ) if v is not None})
+        
+        # Transcription cache: content hash + the settings that affect the output.
+        # The hash resolves "auto" device/compute type, which probes CTranslate2, so it
+        # is computed on first use in the run thread rather than here on the GUI thread.
+        self._settings_hash: Optional[str] = None
+        self._cache_keys: Dict[str, str] = {}
+        
+        # Results are streamed to a per-run JSONL sidecar; only running tallies stay in
+        # memory. The path is set only once this run has created the file (see
+        # _open_results_log).
+        self._results_log = None
+        self._results_log_path: Optional[str] = None
+        self._recorded_paths = set()
+        self._n_success = 0
+        self._n_failed = 0
+        self._sum_processing_time = 0.0
+        self._sum_audio_duration = 0.0
+        self._failed_results: List[Dict[str, Any]] = []
         
         # Threading configuration
         self.thread_config = get_optimal_threading_config()
-        self.max_workers = min(4, len(audio_files))
         
         # Performance monitoring
         self.batch_stats = {
@@ -71,110 +562,545 @@ class BatchTranscriptionThread(QThread):
             "total_batches": 0
         }
     
+    def _file_name(self, file_path: str) -> str:
+        """Base name of an input file, from the names cached at construction."""
+        name = self._name_by_path.get(file_path)
+        return name if name is not None else os.path.basename(file_path)
+    
     def _create_optimized_model(self) -> WhisperModel:
         """Create an optimized WhisperModel with best settings for batch processing."""
+        resolved = self._resolved_model_settings()
+        logger.info(f"Using compute_type={resolved['compute_type']} "
+                    f"on {resolved['device']}")
+        
         model_settings = {
-            "model_size_or_path": self.whisper_settings.get("model_size", "base"),
-            "device": self.whisper_settings.get("device", "cpu"),
-            "compute_type": self.whisper_settings.get("compute_type", "int8"),
-            "cpu_threads": self.thread_config["cpu_threads"],
-            "num_workers": 1,  # Single worker for batch processing
+            **resolved,
+            # int8 GEMMs thrash when SMT siblings share VNNI ports: one thread per
+            # physical core
+            "cpu_threads": _physical_core_count(),
+            # transcribe() is only ever called from this thread: a single worker gets
+            # all cpu_threads for each inference call instead of splitting them across
+            # replicas
+            "num_workers": 1,
         }
         
         # Remove None values
         model_settings = {k: v for k, v in model_settings.items() if v is not None}
+        self._model_key = _model_cache_key(model_settings)
         
         try:
-            model = WhisperModel(**model_settings)
-            logger.info(f"Created optimized model: {model_settings}")
-            return model
+            return _get_cached_model(self._model_key, model_settings)
         except Exception as e:
             logger.error(f"Failed to create optimized model: {e}")
-            # Fallback to basic model
-            return WhisperModel(
-                model_size_or_path="base",
-                device="cpu",
-                compute_type="int8"
-            )
+            # Fallback to basic model (cached as well, so repeated failures don't
+            # reload it)
+            fallback_settings = {
+                "model_size_or_path": "base",
+                "device": "cpu",
+                "compute_type": "int8"
+            }
+            self._model_key = _model_cache_key(fallback_settings)
+            # Results now come from a different model: key the transcription cache by it
+            self._settings_hash = self._compute_settings_hash(fallback_settings)
+            self._cache_keys.clear()
+            return _get_cached_model(self._model_key, fallback_settings)
+    
+    def _resolved_model_settings(self) -> Dict[str, Any]:
+        """Model name, device and compute type this run loads, with "auto" resolved."""
+        device = _resolve_device(self.whisper_settings.get("device", "auto"))
+        compute_type = self.whisper_settings.get("compute_type")
+        if compute_type == "auto":
+            compute_type = None  # Probed below for the resolved device
+        if device == "cuda" and compute_type in (None, "int8"):
+            # Keep int8 weights if asked for, but with float16 activations on the GPU
+            compute_type = "int8_float16" if compute_type == "int8" else None
+        return {
+            "model_size_or_path": self.whisper_settings.get("model_size", "base"),
+            "device": device,
+            "compute_type": compute_type or _default_compute_type(device),
+        }
     
     def _determine_optimal_batch_size(self) -> int:
-        """Determine optimal batch size based on available memory and CPU."""
-        if not self.auto_batch_size:
-            return self.batch_size
-        
-        hw_info = get_hardware_info()
-        memory_gb = hw_info["memory_gb"]
-        physical_cores = hw_info["physical_cores"]
-        
-        # Conservative batch size calculation
-        if memory_gb >= 32:
-            optimal_batch = min(16, physical_cores * 2)
-        elif memory_gb >= 16:
-            optimal_batch = min(8, physical_cores)
-        elif memory_gb >= 8:
-            optimal_batch = min(4, physical_cores // 2)
-        else:
-            optimal_batch = 2
-        
-        # Ensure we don't exceed the number of files
-        optimal_batch = min(optimal_batch, len(self.audio_files))
-        
-        logger.info(f"Determined optimal batch size: {optimal_batch} (Memory: {memory_gb}GB, Cores: {physical_cores})")
-        return optimal_batch
+        """Determine optimal batch size based on available memory and the model size."""
+        memory_gb, _ = _hardware_profile()
+        model_size = self.whisper_settings.get("model_size", "base")
+        return compute_batch_size(memory_gb, len(self.audio_files),
+                                  self.auto_batch_size, self.batch_size, model_size)
     
     def _create_batched_pipeline(self, model: WhisperModel) -> BatchedInferencePipeline:
         """Create a BatchedInferencePipeline for high-performance processing."""
         try:
-            pipeline = BatchedInferencePipeline(
-                model=model,
-                use_cuda=False,  # CPU-only for now
-                chunk_length=30,  # 30-second chunks as recommended
-                batch_size=self._determine_optimal_batch_size()
-            )
-            logger.info(f"Created batched pipeline with batch_size={pipeline.batch_size}")
+            batch_size = self._determine_optimal_batch_size()
+            self._pipeline_batch_size = batch_size
+            pipeline_key = (getattr(self, "_model_key", id(model)), batch_size,
+                            PIPELINE_CHUNK_LENGTH)
+            
+            with _MODEL_CACHE_LOCK:
+                pipeline = _PIPELINE_CACHE.get(pipeline_key)
+                if pipeline is not None and pipeline.model is model:
+                    logger.info(f"Reusing cached batched pipeline with "
+                                f"batch_size={batch_size}")
+                    return pipeline
+                
+                pipeline_options = {
+                    "use_cuda": getattr(model.model, "device", "cpu") == "cuda",
+                    "chunk_length": PIPELINE_CHUNK_LENGTH,
+                    "batch_size": batch_size,
+                }
+                accepted = _accepted_params(BatchedInferencePipeline.__init__)
+                pipeline = BatchedInferencePipeline(
+                    model=model,
+                    **{k: v for k, v in pipeline_options.items() if k in accepted}
+                )
+                _PIPELINE_CACHE[pipeline_key] = pipeline
+            logger.info(f"Created batched pipeline with batch_size={batch_size}")
             return pipeline
         except Exception as e:
             logger.error(f"Failed to create batched pipeline: {e}")
             raise
     
-    def _process_file_with_batched_pipeline(self, pipeline: BatchedInferencePipeline, 
-                                          file_path: str) -> Dict[str, Any]:
-        """Process a single file using the batched pipeline."""
+    def _compute_settings_hash(self,
+                               model_settings: Optional[Dict[str, Any]] = None) -> str:
+        """Hash the settings that change the transcription output.
+        
+        That is the resolved model (name, device, compute type) and every argument
+        passed to transcribe().
+        """
+        model_settings = model_settings or self._resolved_model_settings()
+        relevant = {
+            "model": [model_settings.get(key)
+                      for key in ("model_size_or_path", "device", "compute_type")],
+            "transcribe": dict(self._transcription_kwargs),
+        }
+        return hashlib.blake2b(json.dumps(relevant, sort_keys=True).encode("utf-8"),
+                               digest_size=8).hexdigest()
+    
+    def _transcription_cache_key(self, file_path: str) -> str:
+        """Content hash of the file (memory-mapped) combined with the settings hash."""
+        key = self._cache_keys.get(file_path)
+        if key is None:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        digest.update(mapped)
+            if self._settings_hash is None:
+                self._settings_hash = self._compute_settings_hash()
+            key = f"{digest.hexdigest()}:{self._settings_hash}"
+            self._cache_keys[file_path] = key
+        return key
+    
+    def _cached_transcription(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Look up the transcription cache for this file with the current settings."""
+        try:
+            return self.file_cache.get_transcription(
+                self._transcription_cache_key(file_path)
+            )
+        except OSError:
+            return None
+    
+    def _cached_result(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Build a result dict from the transcription cache, or None on a miss."""
+        cached = self._cached_transcription(file_path)
+        if cached is None:
+            return None
+        
+        logger.info(f"Transcription cache hit: {self._file_name(file_path)}")
+        transcription_text = cached["transcription"]
+        return {
+            "file_path": file_path,
+            "transcription": transcription_text,
+            "segments": cached.get("segments", []),
+            "info": None,
+            "processing_time": 0,
+            "individual_file": self._save_individual_transcription(file_path,
+                                                                   transcription_text),
+            "success": True,
+            "cached": True
+        }
+    
+    def _store_cached_transcription(self, file_path: str, transcription_text: str,
+                                    segments_list: List[Any]) -> None:
+        """Persist a successful transcription under its content/settings key."""
+        try:
+            key = self._transcription_cache_key(file_path)
+            self.file_cache.set_transcription(key, {
+                "transcription": transcription_text,
+                "segments": [{"start": seg.start, "end": seg.end, "text": seg.text}
+                             for seg in segments_list]
+            })
+        except OSError as e:
+            logger.warning(f"Could not cache transcription for {file_path}: {e}")
+    
+    def _decode_audio(self, file_path: str) -> Optional[np.ndarray]:
+        """Decode a file to 16 kHz mono float32, or None to let the pipeline do it."""
+        if self._cached_transcription(file_path) is not None:
+            return None  # Served from the transcription cache, no need to decode
+        try:
+            return load_audio_array(file_path)
+        except Exception as e:
+            logger.warning(f"Pre-decode failed for {file_path}, "
+                           f"pipeline will decode it: {e}")
+            return None
+    
+    def _prepare_audio(self, file_path: str) -> Dict[str, Any]:
+        """Decode a file and, when VAD is enabled, keep only its speech regions.
+        
+        Returns:
+            Dict with the (possibly speech-only) ``audio``, the ``speech_map`` needed
+            to map timestamps back to the original file, the speech ``chunks`` it was
+            cut from (so the pipeline can skip its own VAD pass) and ``no_speech`` for
+            silent files
+        """
+        prepared = {"audio": self._decode_audio(file_path), "speech_map": None,
+                    "chunks": None, "no_speech": False}
+        audio = prepared["audio"]
+        if audio is None or not self.whisper_settings.get("vad_filter", True):
+            return prepared
+        
         try:
-            start_time = time.time()
+            # Regions no longer than a pipeline chunk, so each fits in one clip
+            speech_chunks = get_speech_timestamps(audio, VadOptions(
+                speech_pad_ms=BATCH_VAD_PAD_MS,
+                max_speech_duration_s=PIPELINE_CHUNK_LENGTH))
+        except Exception as e:
+            logger.warning(f"Batch VAD failed for {file_path}, "
+                           f"transcribing full audio: {e}")
+            return prepared
+        
+        if not speech_chunks:
+            prepared["no_speech"] = True
+            prepared["audio"] = None
+        else:
+            prepared["audio"] = np.concatenate([audio[chunk["start"]:chunk["end"]]
+                                                for chunk in speech_chunks])
+            prepared["speech_map"] = SpeechTimestampsMap(speech_chunks, SAMPLING_RATE)
+            prepared["chunks"] = speech_chunks
+        return prepared
+    
+    def _no_speech_result(self, file_path: str) -> Dict[str, Any]:
+        """Result for a file in which the batch-level VAD found no speech."""
+        logger.info(f"No speech detected, skipping inference: "
+                    f"{self._file_name(file_path)}")
+        return {
+            "file_path": file_path,
+            "transcription": "",
+            "segments": [],
+            "info": None,
+            "processing_time": 0,
+            "individual_file": None,
+            "success": True,
+            "no_speech": True
+        }
+    
+    @staticmethod
+    def _remap_segment(segment: Any, speech_map: SpeechTimestampsMap) -> Any:
+        """Map a segment's times from the speech-only audio back to the source file."""
+        start = speech_map.get_original_time(segment.start)
+        end = speech_map.get_original_time(segment.end)
+        if hasattr(segment, "_replace"):
+            return segment._replace(start=start, end=end)
+        return dataclasses.replace(segment, start=start, end=end)
+    
+    def _collect_segment_texts(self, segments: Iterable[Any], segments_list: List[Any],
+                               speech_map: Optional[SpeechTimestampsMap] = None
+                               ) -> Iterator[str]:
+        """Yield segment texts, appending each (remapped) segment to ``segments_list``.
+        
+        Unless word timestamps were requested, only (start, end, text) is retained per
+        segment so results held until the end of the run stay small.
+        """
+        keep_full = self.whisper_settings.get("word_timestamps", False)
+        for segment in segments:
+            if speech_map is not None:
+                segment = self._remap_segment(segment, speech_map)
+            if not keep_full:
+                segment = SegmentSpan(segment.start, segment.end, segment.text)
+            segments_list.append(segment)
+            yield segment.text
+    
+    @staticmethod
+    def _summarize_info(info: Any) -> Optional[Dict[str, Any]]:
+        """Keep only the language and duration of a TranscriptionInfo."""
+        if info is None:
+            return None
+        return {"language": info.language, "duration": info.duration}
+    
+    def _prefetch_decoded(self, file_paths: List[str],
+                          depth: int = 2) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (file_path, prepared audio) while the next files decode in background.
+        
+        At most ``depth`` decodes are in flight, so decoding file N+1 overlaps with
+        inference on file N without holding the whole batch in memory.
+        """
+        paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=depth) as decoder:
+            pending = deque()
+            for file_path in paths:
+                pending.append((file_path,
+                                decoder.submit(self._prepare_audio, file_path)))
+                if len(pending) >= depth:
+                    break
             
-            # Get transcription settings
-            transcription_settings = {
-                "language": self.whisper_settings.get("language"),
-                "task": "transcribe",
-                "beam_size": self.whisper_settings.get("beam_size", 1),
-                "best_of": self.whisper_settings.get("best_of", 1),
-                "temperature": self.whisper_settings.get("temperature", 0.0),
-                "condition_on_previous_text": self.whisper_settings.get("condition_on_previous_text", False),
-                "vad_filter": self.whisper_settings.get("vad_filter", True),
-                "without_timestamps": False
-            }
+            while pending:
+                file_path, future = pending.popleft()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending.append((next_path,
+                                    decoder.submit(self._prepare_audio, next_path)))
+                yield file_path, future.result()
+    
+    def _transcribe_pack(self, pipeline: BatchedInferencePipeline,
+                         pack: List[Tuple[str, Dict[str, Any]]]
+                         ) -> List[Dict[str, Any]]:
+        """Transcribe several short files as one audio stream and split segments back.
+        
+        Files are joined with PACK_GAP_SECONDS of silence; each segment is assigned to
+        the file containing its midpoint and shifted back to that file's own timeline.
+        
+        The silent gap plays the part of a delimiter: Whisper closes segments at
+        pauses, so segment boundaries land in the gaps. When every file was trimmed by
+        the batch VAD, the pipeline decodes each file's clips separately and no segment
+        can cross into a neighbour. Otherwise a segment spanning a gap goes whole to
+        the file holding its midpoint, with its times clamped to that file.
+        """
+        if len(pack) == 1:
+            file_path, prepared = pack[0]
+            return [self._process_file_with_batched_pipeline(
+                pipeline, file_path, prepared["audio"], prepared["speech_map"],
+                prepared["chunks"])]
+        
+        start_time = time.perf_counter()
+        gap = np.zeros(int(PACK_GAP_SECONDS * SAMPLING_RATE), dtype=np.float32)
+        pieces = []
+        offsets = []  # (start_s, end_s) of each file inside the packed stream
+        # Every file already trimmed by the batch VAD: its speech clips, shifted into
+        # the stream
+        clips: Optional[List[Dict[str, float]]] = []
+        position = 0
+        for file_path, prepared in pack:
+            if pieces:
+                pieces.append(gap)
+                position += len(gap)
+            audio = prepared["audio"]
+            offsets.append((position / SAMPLING_RATE,
+                            (position + len(audio)) / SAMPLING_RATE))
+            if clips is not None and prepared["chunks"] is not None:
+                clips.extend(_speech_clips(prepared["chunks"],
+                                           position / SAMPLING_RATE))
+            else:
+                clips = None
+            pieces.append(audio)
+            position += len(audio)
+        
+        try:
+            segments, info = self._pipeline_transcribe(pipeline, np.concatenate(pieces),
+                                                       clips)
+            per_file = [[] for _ in pack]
+            for segment in segments:
+                midpoint = (segment.start + segment.end) / 2
+                index = next((k for k, (_, end) in enumerate(offsets)
+                              if midpoint <= end), len(pack) - 1)
+                file_start, file_end = offsets[index]
+                start = max(0.0, segment.start - file_start)
+                end = max(start, min(segment.end, file_end) - file_start)
+                speech_map = pack[index][1]["speech_map"]
+                if speech_map is not None:
+                    start = speech_map.get_original_time(start)
+                    end = speech_map.get_original_time(end)
+                per_file[index].append(SegmentSpan(start, end, segment.text))
+        except Exception as e:
+            logger.warning(f"Packed transcription failed, "
+                           f"transcribing files individually: {e}")
+            return [self._process_file_with_batched_pipeline(
+                        pipeline, file_path, prepared["audio"], prepared["speech_map"],
+                        prepared["chunks"])
+                    for file_path, prepared in pack]
+        
+        # Attribute the pack's wall time to its files in proportion to their length
+        elapsed = time.perf_counter() - start_time
+        total_seconds = sum(end - start for start, end in offsets)
+        results = []
+        for (file_path, _), (file_start, file_end), segments_list in zip(pack, offsets,
+                                                                         per_file):
+            transcription_text = " ".join(segment.text for segment in segments_list)
+            self._store_cached_transcription(file_path, transcription_text,
+                                             segments_list)
+            results.append({
+                "file_path": file_path,
+                "transcription": transcription_text,
+                "segments": segments_list,
+                "info": {"language": info.language, "duration": file_end - file_start},
+                "processing_time": (elapsed * (file_end - file_start) / total_seconds
+                                    if total_seconds else 0),
+                "individual_file": self._save_individual_transcription(
+                    file_path, transcription_text),
+                "success": True
+            })
+        return results
+    
+    def _open_results_log(self) -> None:
+        """Create this run's private JSONL sidecar, which receives each result."""
+        try:
+            fd, path = tempfile.mkstemp(prefix="vox_results_", suffix=".jsonl")
+            self._results_log = os.fdopen(fd, "w", encoding="utf-8", buffering=1)
+            self._results_log_path = path
+        except OSError as e:
+            logger.warning(f"Could not create results log: {e}")
+            self._results_log = None
+            self._results_log_path = None
+    
+    def _close_results_log(self) -> None:
+        """Close the results sidecar, if open."""
+        if self._results_log is not None:
+            self._results_log.close()
+            self._results_log = None
+    
+    def _discard_results_log(self) -> None:
+        """Close and delete the results sidecar once the report no longer needs it."""
+        self._close_results_log()
+        if self._results_log_path is not None:
+            try:
+                os.remove(self._results_log_path)
+            except OSError as e:
+                logger.warning(f"Could not remove results log "
+                               f"{self._results_log_path}: {e}")
+            self._results_log_path = None
+    
+    def _stream_result(self, result: Dict[str, Any]) -> None:
+        """Write one file's result to the sidecar and add it to the running tallies."""
+        self._recorded_paths.add(result["file_path"])
+        if result["success"]:
+            self._n_success += 1
+            self._sum_processing_time += result.get("processing_time", 0)
+            # Cache hits and silent files carry no info (and add no audio time)
+            info = result.get("info") or {}
+            self._sum_audio_duration += info.get("duration") or 0
+        else:
+            self._n_failed += 1
+            self._failed_results.append({
+                "file_path": result["file_path"],
+                "filename": self._file_name(result["file_path"]),
+                "error": result.get("error", "Erro desconhecido"),
+                "success": False
+            })
+        
+        if self._results_log is not None:
+            try:
+                self._results_log.write(
+                    json.dumps(result, ensure_ascii=False, default=str) + "\n")
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Could not log result for {result['file_path']}: {e}")
+    
+    def _iter_logged_transcriptions(self) -> Iterator[Tuple[str, str]]:
+        """Yield (file_path, transcription) for each successful result logged."""
+        if self._results_log_path is None:
+            return
+        with open(self._results_log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    continue
+                if result.get("success"):
+                    yield result["file_path"], result.get("transcription", "")
+    
+    def _flush_progress(self) -> None:
+        """Send any coalesced progress and transcription text to the UI now."""
+        self._status_emitter.flush()
+        self._transcription_emitter.flush()
+    
+    def _record_batch_result(self, result: Dict[str, Any],
+                             batch_mode: bool = True) -> None:
+        """Stream one file's result and report it to the UI."""
+        self._stream_result(result)
+        self.batch_stats["processed_files"] += 1
+        
+        # Update progress
+        progress = (self.batch_stats["processed_files"] / self.batch_stats["total_files"]) * 100
+        if batch_mode:
+            text = (f"Batch {self.batch_stats['current_batch']}/"
+                    f"{self.batch_stats['total_batches']}: "
+                    f"{self._file_name(result['file_path'])} "
+                    f"({result['processing_time']:.1f}s)")
+        else:
+            text = (f"Processando {self._file_name(result['file_path'])} "
+                    f"({result['processing_time']:.1f}s)")
+        self._status_emitter.emit({
+            "text": text,
+            "progress": progress,
+            "batch_mode": batch_mode
+        })
+        
+        if result["success"]:
+            self._transcription_emitter.emit(result["transcription"])
+    
+    def _pipeline_transcribe(self, pipeline: Any, audio,
+                             clips: Optional[List[Dict[str, float]]] = None
+                             ) -> Tuple[Iterable[Any], Any]:
+        """Call ``pipeline.transcribe`` with the frozen arguments and accepted batching.
+        
+        ``clips`` is set when ``audio`` was already trimmed to speech by the batch-level
+        VAD: the pipeline's own VAD pass is then skipped and the clips given instead.
+        """
+        kwargs = self._transcription_kwargs
+        if clips is not None:
+            kwargs = {**kwargs, "vad_filter": False}
+        if not isinstance(pipeline, BatchedInferencePipeline):
+            return pipeline.transcribe(audio, **kwargs)
+        
+        accepted = _accepted_params(BatchedInferencePipeline.transcribe)
+        batching = {"batch_size": self._pipeline_batch_size,
+                    "chunk_length": PIPELINE_CHUNK_LENGTH, "clip_timestamps": clips}
+        return pipeline.transcribe(audio, **kwargs,
+                                   **{k: v for k, v in batching.items()
+                                      if k in accepted and v is not None})
+    
+    def _process_file_with_batched_pipeline(
+            self, pipeline: BatchedInferencePipeline, file_path: str, audio=None,
+            speech_map: Optional[SpeechTimestampsMap] = None,
+            speech_chunks: Optional[List[Dict[str, int]]] = None) -> Dict[str, Any]:
+        """Process a single file using the batched pipeline.
+        
+        Args:
+            pipeline: Batched inference pipeline
+            file_path: Path of the source file (used for naming and reporting)
+            audio: Optional pre-decoded 16 kHz waveform; decoded from file_path if None
+            speech_map: Set when ``audio`` holds only speech regions, to restore the
+                original timestamps
+            speech_chunks: The speech regions ``audio`` was cut from, so the pipeline
+                skips its VAD
+        """
+        try:
+            cached = self._cached_result(file_path)
+            if cached is not None:
+                return cached
             
-            # Remove None values
-            transcription_settings = {k: v for k, v in transcription_settings.items() if v is not None}
+            start_time = time.perf_counter()
             
             # Transcribe using batched pipeline
-            segments, info = pipeline.transcribe(file_path, **transcription_settings)
+            source = audio if audio is not None else file_path
+            clips = _speech_clips(speech_chunks) if speech_chunks is not None else None
+            segments, info = self._pipeline_transcribe(pipeline, source, clips)
             
-            # Convert segments to list and extract text
-            segments_list = list(segments)
-            transcription_text = " ".join([segment.text for segment in segments_list])
+            # Single pass over the segment generator: collect segments, join the text
+            segments_list = []
+            transcription_text = " ".join(
+                self._collect_segment_texts(segments, segments_list, speech_map))
+            self._store_cached_transcription(file_path, transcription_text,
+                                             segments_list)
             
             # Salva transcrição individual com nome baseado no arquivo original
+            # (em segundo plano)
             individual_file = self._save_individual_transcription(file_path, transcription_text)
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             return {
                 "file_path": file_path,
                 "transcription": transcription_text,
                 "segments": segments_list,
-                "info": info,
+                "info": self._summarize_info(info),
                 "processing_time": processing_time,
                 "individual_file": individual_file,
                 "success": True
@@ -192,141 +1118,242 @@ class BatchTranscriptionThread(QThread):
                 "error": str(e)
             }
     
-    def _process_files_in_batches(self, model: WhisperModel) -> List[Dict[str, Any]]:
-        """Process files in optimized batches."""
-        results = []
+    def _process_files_in_batches(self, model: WhisperModel) -> None:
+        """Process files in optimized batches, streaming each result as it completes.
         
+        Single files, runs with batching disabled and batched runs that fail all go
+        through the same loop with a sequential adapter around the model.
+        """
         if self.use_batched_inference and len(self.audio_files) > 1:
             # Use BatchedInferencePipeline for multiple files
             try:
                 pipeline = self._create_batched_pipeline(model)
-                
-                batch_size = self._determine_optimal_batch_size()
-                self.batch_stats["total_batches"] = (len(self.audio_files) + batch_size - 1) // batch_size
-                
-                for i in range(0, len(self.audio_files), batch_size):
-                    if not self._is_running:
-                        break
-                        
-                    batch = self.audio_files[i:i + batch_size]
-                    self.batch_stats["current_batch"] = i // batch_size + 1
-                    
-                    # Update batch progress
-                    self.batch_progress.emit({
-                        "current_batch": self.batch_stats["current_batch"],
-                        "total_batches": self.batch_stats["total_batches"],
-                        "batch_size": len(batch),
-                        "files_in_batch": [os.path.basename(f) for f in batch]
-                    })
-                    
-                    # Process batch with ThreadPoolExecutor for parallel I/O
-                    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batch))) as executor:
-                        batch_futures = {
-                            executor.submit(self._process_file_with_batched_pipeline, pipeline, file_path): file_path
-                            for file_path in batch
-                        }
-                        
-                        for future in as_completed(batch_futures):
-                            result = future.result()
-                            results.append(result)
-                            
-                            self.batch_stats["processed_files"] += 1
-                            
-                            # Update progress
-                            progress = (self.batch_stats["processed_files"] / self.batch_stats["total_files"]) * 100
-                            self.update_status.emit({
-                                "text": f"Batch {self.batch_stats['current_batch']}/{self.batch_stats['total_batches']}: "
-                                       f"{os.path.basename(result['file_path'])} "
-                                       f"({result['processing_time']:.1f}s)",
-                                "progress": progress,
-                                "batch_mode": True
-                            })
-                            
-                            if result["success"]:
-                                self.update_transcription.emit(result["transcription"])
-                
+                self._run_pipeline(pipeline, self._determine_optimal_batch_size(),
+                                   batch_mode=True)
+                return
             except Exception as e:
                 logger.error(f"Batch processing failed: {e}")
-                # Fallback to sequential processing
-                results = self._process_files_sequential(model)
-                
-        else:
-            # Sequential processing for single files or if batching disabled
-            results = self._process_files_sequential(model)
         
-        return results
+        # Sequential processing for the files not recorded yet
+        pending = [f for f in self.audio_files if f not in self._recorded_paths]
+        if pending:
+            self._run_pipeline(_SequentialPipeline(model), len(pending),
+                               batch_mode=False)
     
-    def _process_files_sequential(self, model: WhisperModel) -> List[Dict[str, Any]]:
-        """Fallback sequential processing method."""
-        results = []
+    def _probe_duration(self, file_path: str) -> Optional[float]:
+        """Duration in seconds from the file header (cached), or None."""
+        duration = self.file_cache.get_duration(file_path)
+        if duration is not None:
+            return duration
+        
+        try:
+            import soundfile as sf
+            duration = sf.info(file_path).duration
+        except Exception:
+            try:
+                import av
+                with av.open(file_path) as container:
+                    duration = (container.duration / av.time_base
+                                if container.duration else None)
+            except Exception as e:
+                logger.debug(f"Could not probe duration of {file_path}: {e}")
+                return None
+        
+        if duration is not None:
+            self.file_cache.set_duration(file_path, duration)
+        return duration
+    
+    def _bucket_files_by_duration(self, files: List[str]) -> List[List[str]]:
+        """Group files into duration buckets (see DURATION_BUCKET_EDGES), longest first.
+        
+        Batching within a bucket keeps similar lengths together so the pipeline pads
+        less. Buckets and the files inside them are ordered longest first (LPT
+        scheduling), so the file on the critical path starts early instead of running
+        alone at the end; files whose duration cannot be probed go in the longest
+        bucket.
+        """
+        buckets: List[List[Tuple[float, str]]] = [
+            [] for _ in range(len(DURATION_BUCKET_EDGES) + 1)]
+        for file_path in files:
+            duration = self._probe_duration(file_path)
+            if duration is None:
+                duration = float("inf")
+            index = next((k for k, edge in enumerate(DURATION_BUCKET_EDGES)
+                          if duration < edge), len(DURATION_BUCKET_EDGES))
+            buckets[index].append((duration, file_path))
+        return [[file_path for _, file_path in sorted(bucket, key=lambda item: item[0],
+                                                      reverse=True)]
+                for bucket in reversed(buckets) if bucket]
+    
+    def _run_pipeline(self, pipeline: Any, batch_size: int, batch_mode: bool) -> None:
+        """Transcribe every file not yet recorded, ``batch_size`` files at a time."""
+        files = [f for f in self.audio_files if f not in self._recorded_paths]
+        buckets = self._bucket_files_by_duration(files) if batch_mode else [files]
+        batches = [bucket[j:j + batch_size] for bucket in buckets
+                   for j in range(0, len(bucket), batch_size)]
+        self.batch_stats["total_batches"] = len(batches)
         
-        for i, file_path in enumerate(self.audio_files):
+        for batch_index, batch in enumerate(batches):
             if not self._is_running:
                 break
                 
-            try:
-                start_time = time.time()
-                
-                # Use regular transcription method
-                segments, info = model.transcribe(
-                    file_path,
-                    language=self.whisper_settings.get("language"),
-                    beam_size=self.whisper_settings.get("beam_size", 1),
-                    best_of=self.whisper_settings.get("best_of", 1),
-                    temperature=self.whisper_settings.get("temperature", 0.0),
-                    condition_on_previous_text=self.whisper_settings.get("condition_on_previous_text", False),
-                    vad_filter=self.whisper_settings.get("vad_filter", True)
-                )
-                
-                segments_list = list(segments)
-                transcription_text = " ".join([segment.text for segment in segments_list])
-                
-                # Salva transcrição individual com nome baseado no arquivo original
-                individual_file = self._save_individual_transcription(file_path, transcription_text)
-                
-                processing_time = time.time() - start_time
-                
-                result = {
-                    "file_path": file_path,
-                    "transcription": transcription_text,
-                    "segments": segments_list,
-                    "info": info,
-                    "processing_time": processing_time,
-                    "individual_file": individual_file,
-                    "success": True
-                }
-                
-                results.append(result)
-                
-                progress = ((i + 1) / len(self.audio_files)) * 100
-                self.update_status.emit({
-                    "text": f"Processando {os.path.basename(file_path)} ({processing_time:.1f}s)",
-                    "progress": progress,
-                    "batch_mode": False
-                })
+            self.batch_stats["current_batch"] = batch_index + 1
+            
+            # Update batch progress
+            self.batch_progress.emit({
+                "current_batch": self.batch_stats["current_batch"],
+                "total_batches": self.batch_stats["total_batches"],
+                "batch_size": len(batch),
+                "files_in_batch": [self._name_by_path[f] for f in batch]
+            })
+            
+            # Decode ahead in the background (PyAV releases the GIL) while inference
+            # runs
+            # in this thread: the batched pipeline already batches chunks of a file, so
+            # concurrent transcribe() calls would only contend for the model
+            pack: List[Tuple[str, Dict[str, Any]]] = []
+            pack_samples = 0
+            for file_path, prepared in self._prefetch_decoded(batch):
+                if not self._is_running:
+                    break
                 
-                self.update_transcription.emit(transcription_text)
+                audio = prepared["audio"]
+                if (batch_mode and audio is not None
+                        and len(audio) < SHORT_FILE_MAX_SECONDS * SAMPLING_RATE):
+                    # Short file: hold it back to share a 30 s window with neighbours
+                    gap_samples = int(PACK_GAP_SECONDS * SAMPLING_RATE) if pack else 0
+                    packed = pack_samples + gap_samples + len(audio)
+                    if pack and packed > PACK_MAX_SECONDS * SAMPLING_RATE:
+                        for result in self._transcribe_pack(pipeline, pack):
+                            self._record_batch_result(result, batch_mode)
+                        pack, pack_samples, gap_samples = [], 0, 0
+                    pack.append((file_path, prepared))
+                    pack_samples += gap_samples + len(audio)
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {e}")
-                results.append({
-                    "file_path": file_path,
-                    "transcription": "",
-                    "segments": [],
-                    "info": None,
-                    "processing_time": 0,
-                    "success": False,
-                    "error": str(e)
-                })
+                if prepared["no_speech"]:
+                    result = self._no_speech_result(file_path)
+                else:
+                    result = self._process_file_with_batched_pipeline(
+                        pipeline, file_path, audio, prepared["speech_map"],
+                        prepared["chunks"]
+                    )
+                self._record_batch_result(result, batch_mode)
+            
+            # End of batch: flush whatever short files are still waiting
+            if pack and self._is_running:
+                for result in self._transcribe_pack(pipeline, pack):
+                    self._record_batch_result(result, batch_mode)
+            self._flush_progress()
+    
+    def _use_process_pool(self) -> bool:
+        """Whether to transcribe across worker processes instead of one model."""
+        _, physical_cores = _hardware_profile()
+        model_family = _model_family(self.whisper_settings.get("model_size", "base"))
+        return (
+            physical_cores >= PROCESS_POOL_MIN_CORES
+            and model_family in PROCESS_POOL_MODEL_FAMILIES
+            and len(self.audio_files) > 1
+            and _resolve_device(self.whisper_settings.get("device", "auto")) == "cpu"
+        )
+    
+    def _report_pool_progress(self, progress_queue, pending: int) -> None:
+        """Reader thread: turn worker completion messages into update_status signals."""
+        for _ in range(pending):
+            message = progress_queue.get()
+            if message is None:
+                break
+            file_path, processing_time = message
+            self.batch_stats["processed_files"] += 1
+            progress = (self.batch_stats["processed_files"] / self.batch_stats["total_files"]) * 100
+            self._status_emitter.emit({
+                "text": (f"Processo paralelo: {self._file_name(file_path)} "
+                         f"({processing_time:.1f}s)"),
+                "progress": progress,
+                "batch_mode": True
+            })
+    
+    def _process_files_in_process_pool(self) -> None:
+        """Transcribe files in spawned worker processes, each with its own small model.
         
-        return results
+        Every worker loads the model lazily through the process-wide cache with
+        PROCESS_POOL_THREADS_PER_WORKER CTranslate2 threads.
+        """
+        _, physical_cores = _hardware_profile()
+        model_settings = {
+            # _use_process_pool only picks the pool when the device resolves to the CPU
+            **self._resolved_model_settings(),
+            "cpu_threads": PROCESS_POOL_THREADS_PER_WORKER,
+            "num_workers": 1,
+        }
+        to_transcribe = []
+        for file_path in self.audio_files:
+            cached = self._cached_result(file_path)
+            if cached is not None:
+                self._stream_result(cached)
+                self.batch_stats["processed_files"] += 1
+                self._transcription_emitter.emit(cached["transcription"])
+            else:
+                to_transcribe.append(file_path)
+        
+        if to_transcribe:
+            # Longest first, so the longest file overlaps with the short ones on other
+            # workers
+            buckets = self._bucket_files_by_duration(to_transcribe)
+            to_transcribe = [f for bucket in buckets for f in bucket]
+            num_workers = max(1, min(physical_cores // PROCESS_POOL_THREADS_PER_WORKER,
+                                     len(to_transcribe)))
+            logger.info(f"Transcribing {len(to_transcribe)} files in {num_workers} "
+                        f"worker processes "
+                        f"({PROCESS_POOL_THREADS_PER_WORKER} threads each)")
+            
+            # spawn, not fork: this QThread runs alongside the writer/reader threads in
+            # a process that has already loaded CTranslate2/OpenMP, and forking that can
+            # deadlock
+            context = mp.get_context("spawn")
+            progress_queue = context.Queue()
+            reader = threading.Thread(target=self._report_pool_progress,
+                                      args=(progress_queue, len(to_transcribe)),
+                                      daemon=True)
+            reader.start()
+            
+            worker_counter = context.Value("i", 0)
+            executor = ProcessPoolExecutor(max_workers=num_workers, mp_context=context,
+                                           initializer=_init_inference_worker,
+                                           initargs=(progress_queue, worker_counter,
+                                                     num_workers,
+                                                     PROCESS_POOL_THREADS_PER_WORKER))
+            try:
+                futures = [executor.submit(_transcribe_in_worker, file_path,
+                                           model_settings,
+                                           dict(self._transcription_kwargs))
+                           for file_path in to_transcribe]
+                for future in as_completed(futures):
+                    if not self._is_running:
+                        break
+                    result = future.result()
+                    file_path = result["file_path"]
+                    if result["success"]:
+                        self._store_cached_transcription(file_path,
+                                                         result["transcription"],
+                                                         result["segments"])
+                        result["individual_file"] = self._save_individual_transcription(
+                            file_path, result["transcription"])
+                        self._transcription_emitter.emit(result["transcription"])
+                    else:
+                        logger.error(f"Error processing {file_path}: {result['error']}")
+                    self._stream_result(result)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                progress_queue.put(None)  # Release the reader if files were cancelled
+                reader.join(timeout=1.0)
+        self._flush_progress()
     
     def run(self):
         """Main execution thread for batch transcription with enhanced monitoring."""
-        successful_results = []
-        failed_results = []
         total_time = 0
         final_report = ""
+        report_context = None
         
         try:
             # Start enhanced monitoring
@@ -335,34 +1362,47 @@ class BatchTranscriptionThread(QThread):
             
             # Phase 1: Initialization
             self.timestamp_manager.start_phase("initialization")
-            self.batch_stats["start_time"] = time.time()
+            self.batch_stats["start_time"] = time.perf_counter()
+            _lazy_imports()  # In this thread, so constructing the thread stays cheap
             
-            # Create optimized model
-            model = self._create_optimized_model()
+            # Create optimized model (pool workers load their own instead)
+            use_process_pool = self._use_process_pool()
+            model = None if use_process_pool else self._create_optimized_model()
             self.timestamp_manager.end_phase("initialization")
             
             # Phase 2: Processing
             self.timestamp_manager.start_phase("processing")
-            results = self._process_files_in_batches(model)
+            self._open_results_log()
+            if model is None:
+                self._process_files_in_process_pool()
+            else:
+                self._process_files_in_batches(model)
+            self._close_results_log()
+            # Individual files are complete before completion is reported
+            self._stop_writer()
+            self._flush_progress()
             self.timestamp_manager.end_phase("processing")
             
             # Phase 3: Report Generation
             self.timestamp_manager.start_phase("report_generation")
             
             # Calculate final statistics
-            total_time = time.time() - self.batch_stats["start_time"]
-            successful_results = [r for r in results if r["success"]]
-            failed_results = [r for r in results if not r["success"]]
+            total_time = time.perf_counter() - self.batch_stats["start_time"]
             
             # Generate enhanced final report
-            final_report = self._generate_enhanced_final_report(successful_results, failed_results, total_time)
+            report_context = self._build_report_context(total_time)
+            self._discard_results_log()
+            final_report = self._generate_enhanced_final_report(report_context)
+            # The texts are in the report now; release them before the popup is built
+            report_context.pop('transcriptions', None)
             self.timestamp_manager.end_phase("report_generation")
             
             # Limpeza de arquivos temporários após processamento em lote
             self._cleanup_chunks_and_temp_files()
             
             self.update_status.emit({
-                "text": f"Batch concluído: {len(successful_results)}/{len(results)} arquivos processados",
+                "text": (f"Batch concluído: {self._n_success}/"
+                         f"{self._n_success + self._n_failed} arquivos processados"),
                 "progress": 100,
                 "batch_mode": True,
                 "final_report": final_report
@@ -372,6 +1412,7 @@ class BatchTranscriptionThread(QThread):
             
         except Exception as e:
             logger.error(f"Batch transcription failed: {e}")
+            self._flush_progress()
             self.update_status.emit({
                 "text": f"Erro no processamento em lote: {e}",
                 "progress": 0,
@@ -379,25 +1420,30 @@ class BatchTranscriptionThread(QThread):
                 "error": str(e)
             })
         finally:
+            self._discard_results_log()
+            self._stop_writer()
+            self.file_cache.flush()
+            
             # Stop monitoring and finalize session
             self.performance_monitor.stop_monitoring()
             self.timestamp_manager.end_session("batch_transcription")
             
             # Prepare performance data for popup after session is finalized
-            if successful_results or failed_results:  # Only emit if we have some results
-                completion_data = self._prepare_completion_data(successful_results, failed_results, total_time, final_report)
+            if self._n_success or self._n_failed:  # Only emit if we have some results
+                completion_data = self._prepare_completion_data(
+                    total_time, final_report, report_context)
                 self.completion_data_ready.emit(completion_data)
     
-    def _prepare_completion_data(self, successful_results: List[Dict], 
-                               failed_results: List[Dict], total_time: float, 
-                               final_report: str) -> Dict[str, Any]:
-        """Prepare performance data for completion popup."""
-        # Calculate audio duration
-        total_audio_duration = sum(r.get('duration', 0) for r in successful_results)
+    def _prepare_completion_data(self, total_time: float, final_report: str,
+                                 context: Optional[Dict[str, Any]] = None
+                                 ) -> Dict[str, Any]:
+        """Prepare performance data for completion popup.
         
-        # Calculate speedup
-        estimated_sequential_time = sum(r.get('processing_time', 0) for r in successful_results)
-        speedup = estimated_sequential_time / total_time if total_time > 0 else 1.0
+        Reuses the report context built for the final report when available.
+        """
+        if context is None:
+            context = self._build_report_context(total_time,
+                                                 include_transcriptions=False)
         
         # Get system information
         timing_summary = self.timestamp_manager.get_session_summary()
@@ -411,89 +1457,116 @@ class BatchTranscriptionThread(QThread):
         device = self.settings.get('device') or self.whisper_settings.get('device', 'cpu')
         compute_type = self.settings.get('compute_type') or self.whisper_settings.get('compute_type', 'int8')
         
-        # Debug logging
-        print(f"DEBUG Batch: Settings: {self.settings}")
-        print(f"DEBUG Batch: WhisperSettings: {self.whisper_settings}")
-        print(f"DEBUG Batch: Final values - Model: {model_size}, Device: {device}, Compute: {compute_type}")
+        logger.debug("Batch completion: model=%s device=%s compute=%s",
+                     model_size, device, compute_type)
         
         return {
             'total_files': len(self.audio_files),
-            'successful_files': len(successful_results),
-            'failed_files': len(failed_results),
+            'successful_files': context['n_success'],
+            'failed_files': context['n_failed'],
             'total_processing_time': total_time,
-            'success_rate': (len(successful_results) / len(self.audio_files) * 100) if self.audio_files else 0,
-            'average_time_per_file': total_time / len(successful_results) if successful_results else 0,
-            'audio_duration_total': total_audio_duration,
-            'speedup': speedup,
+            'success_rate': ((context['n_success'] / len(self.audio_files) * 100)
+                             if self.audio_files else 0),
+            'average_time_per_file': (total_time / context['n_success']
+                                      if context['n_success'] else 0),
+            'audio_duration_total': context['total_duration'],
+            'speedup': context['speedup'],
             'start_time': timing_summary.get('start_time', 'N/A'),
             'end_time': timing_summary.get('end_time', current_time),
             'model_size': model_size,
             'device': device,
             'compute_type': compute_type,
-            'full_report': final_report,
-            'failed_results': failed_results
+            # The full report stays on disk; the popup reads it only when asked to and
+            # deletes it on close
+            'report_path': self._write_report_file(final_report),
+            'full_report_preview': final_report[:REPORT_PREVIEW_CHARS],
+            'failed_results': context['failures']
         }
     
-    def _generate_enhanced_final_report(self, successful_results: List[Dict], 
-                                      failed_results: List[Dict], total_time: float) -> str:
+    def _write_report_file(self, final_report: str) -> Optional[str]:
+        """Save the full report to a temporary .txt file and return its path."""
+        try:
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt",
+                                             prefix="vox_report_", delete=False) as tmp:
+                tmp.write(final_report)
+            return tmp.name
+        except OSError as e:
+            logger.warning(f"Could not write the full report to disk: {e}")
+            return None
+    
+    def _build_report_context(self, total_time: float,
+                              include_transcriptions: bool = True) -> Dict[str, Any]:
+        """Gather everything the report formatters and completion data need in one pass.
+        
+        Statistics come from the running tallies; transcription texts are read back
+        from the results sidecar once, rather than kept in memory during the run.
+        """
+        transcriptions = [
+            {'filename': self._file_name(file_path), 'content': transcription}
+            for file_path, transcription in self._iter_logged_transcriptions()
+        ] if include_transcriptions else []
+        return {
+            'total_time': total_time,
+            'transcriptions': transcriptions,
+            'n_success': self._n_success,
+            'n_failed': self._n_failed,
+            'total_duration': self._sum_audio_duration,
+            'total_proc_time': self._sum_processing_time,
+            'avg_proc_time': (self._sum_processing_time / self._n_success
+                              if self._n_success else 0),
+            'speedup': (self._sum_processing_time / total_time
+                        if total_time > 0 else 1.0),
+            'failures': self._failed_results
+        }
+    
+    def _generate_enhanced_final_report(self, context: Dict[str, Any]) -> str:
         """Generate enhanced final report using the new reporting system."""
+        total_time = context['total_time']
+        n_success = context['n_success']
         
         # Prepare transcription results data
         transcription_results = {
             'total_files': len(self.audio_files),
-            'successful_files': len(successful_results),
-            'failed_files': len(failed_results),
+            'successful_files': n_success,
+            'failed_files': context['n_failed'],
             'total_processing_time': total_time,
-            'success_rate': len(successful_results) / len(self.audio_files) * 100 if self.audio_files else 0,
-            'average_time_per_file': total_time / len(successful_results) if successful_results else 0,
-            'failed_results': failed_results
+            'success_rate': (n_success / len(self.audio_files) * 100
+                             if self.audio_files else 0),
+            'average_time_per_file': total_time / n_success if n_success else 0,
+            'failed_results': context['failures']
         }
         
         # Calculate audio duration and RTF
-        total_audio_duration = 0
-        transcriptions = []
-        
-        for result in successful_results:
-            if 'duration' in result:
-                total_audio_duration += result['duration']
-            
-            # Collect transcription content
-            if 'transcription' in result:
-                transcriptions.append({
-                    'filename': os.path.basename(result.get('file_path', 'Unknown')),
-                    'content': result['transcription']
-                })
-        
-        if total_audio_duration > 0:
-            transcription_results['audio_duration_total'] = total_audio_duration
+        if context['total_duration'] > 0:
+            transcription_results['audio_duration_total'] = context['total_duration']
             
         # Estimate sequential time for speedup calculation
-        if successful_results:
-            avg_sequential_time = sum(r.get('processing_time', 0) for r in successful_results)
-            transcription_results['estimated_sequential_time'] = avg_sequential_time
+        if n_success:
+            transcription_results['estimated_sequential_time'] = (
+                context['total_proc_time'])
         
-        transcription_results['transcriptions'] = transcriptions
+        transcription_results['transcriptions'] = context['transcriptions']
         
         # Generate comprehensive report
         return self.report_generator.generate_comprehensive_report(
-            transcription_results, 
+            transcription_results,
             self.settings,
             include_transcriptions=True
         )
     
-    def _generate_final_report(self, successful_results: List[Dict], 
-                             failed_results: List[Dict], total_time: float) -> str:
+    def _generate_final_report(self, context: Dict[str, Any]) -> str:
         """Generate a comprehensive final report with statistics and full transcriptions."""
+        total_time = context['total_time']
+        
         # Start with transcriptions section
         full_transcriptions = []
         
         # Add all transcribed content
-        if successful_results:
-            for result in successful_results:
-                filename = os.path.basename(result['file_path'])
-                transcription = result.get('transcription', '').strip()
-                if transcription:
-                    full_transcriptions.append(f"--- {filename} ---\n{transcription}")
+        for item in context['transcriptions']:
+            transcription = item['content'].strip()
+            if transcription:
+                full_transcriptions.append(
+                    f"--- {item['filename']} ---\n{transcription}")
         
         # Combine all transcriptions
         transcription_text = "\n\n".join(full_transcriptions)
@@ -501,30 +1574,28 @@ class BatchTranscriptionThread(QThread):
         # Add statistics section
         stats_report = []
         stats_report.append(f"\n\n{'='*60}")
-        stats_report.append(f"🎯 RELATÓRIO DE PROCESSAMENTO EM LOTE")
+        stats_report.append("🎯 RELATÓRIO DE PROCESSAMENTO EM LOTE")
         stats_report.append(f"{'='*60}")
-        stats_report.append(f"📊 Estatísticas Gerais:")
+        stats_report.append("📊 Estatísticas Gerais:")
         stats_report.append(f"   • Total de arquivos: {len(self.audio_files)}")
-        stats_report.append(f"   • Processados com sucesso: {len(successful_results)}")
-        stats_report.append(f"   • Falharam: {len(failed_results)}")
+        stats_report.append(f"   • Processados com sucesso: {context['n_success']}")
+        stats_report.append(f"   • Falharam: {context['n_failed']}")
         stats_report.append(f"   • Tempo total de processamento: {total_time:.1f}s ({total_time/60:.1f} min)")
         
-        if successful_results:
-            avg_time = sum(r["processing_time"] for r in successful_results) / len(successful_results)
-            stats_report.append(f"   • Tempo médio por arquivo: {avg_time:.1f}s")
-            total_duration = sum(r.get("duration", 0) for r in successful_results)
-            if total_duration > 0:
-                real_time_factor = total_duration / total_time
+        if context['n_success']:
+            stats_report.append(f"   • Tempo médio por arquivo: "
+                                f"{context['avg_proc_time']:.1f}s")
+            if context['total_duration'] > 0:
+                real_time_factor = context['total_duration'] / total_time
                 stats_report.append(f"   • Fator tempo real: {real_time_factor:.1f}x")
             
             # Calculate speedup estimation
-            if len(successful_results) > 1:
-                sequential_estimate = sum(r["processing_time"] for r in successful_results)
-                speedup = sequential_estimate / total_time
-                stats_report.append(f"   • Speedup por paralelização: {speedup:.1f}x")
+            if context['n_success'] > 1:
+                stats_report.append(f"   • Speedup por paralelização: "
+                                    f"{context['speedup']:.1f}x")
         
         # Add configuration details
-        stats_report.append(f"\n⚙️ Configurações Utilizadas:")
+        stats_report.append("\n⚙️ Configurações Utilizadas:")
         stats_report.append(f"   • Modelo: {self.settings.get('model_size', 'N/A')}")
         stats_report.append(f"   • Dispositivo: {self.settings.get('device', 'N/A')}")
         stats_report.append(f"   • Tipo de computação: {self.settings.get('compute_type', 'N/A')}")
@@ -536,10 +1607,10 @@ class BatchTranscriptionThread(QThread):
         stats_report.append(f"   • Temperatura: {self.settings.get('temperature', 0.0)}")
         stats_report.append(f"   • Beam size: {self.settings.get('beam_size', 5)}")
         
-        if failed_results:
-            stats_report.append(f"\n❌ Arquivos com erro:")
-            for result in failed_results:
-                filename = os.path.basename(result['file_path'])
+        if context['failures']:
+            stats_report.append("\n❌ Arquivos com erro:")
+            for result in context['failures']:
+                filename = result['filename']
                 error_msg = result.get('error', 'Erro desconhecido')
                 stats_report.append(f"   • {filename}: {error_msg}")
         
@@ -556,61 +1627,105 @@ class BatchTranscriptionThread(QThread):
             # Pega diretórios únicos dos arquivos sendo processados
             directories = list(set([os.path.dirname(f) for f in self.audio_files]))
         
-        cleanup_patterns = [
-            "*_chunk_*.wav",
-            "*_ffmpeg_chunk_*.wav", 
-            "*_silence_chunk_*.wav",
-            "*_accelerated*.wav",
-            "*_processed*.wav",
-            "*_extracted*.wav"
-        ]
-        
-        import glob
         total_cleaned = 0
+        failures = []
         
+        # One directory listing per directory, matched against one precompiled pattern
         for directory in directories:
-            cleaned_files = 0
-            for pattern in cleanup_patterns:
-                pattern_path = os.path.join(directory, pattern)
-                for file_path in glob.glob(pattern_path):
-                    try:
-                        os.remove(file_path)
-                        cleaned_files += 1
+            try:
+                entries = list(os.scandir(directory or "."))
+            except OSError as e:
+                failures.append(f"{directory}: {e}")
+                continue
+            for entry in entries:
+                if not _CLEANUP_RE.match(entry.name):
+                    continue
+                try:
+                    if entry.is_file():
+                        os.remove(entry.path)
                         total_cleaned += 1
-                    except Exception as e:
-                        logger.warning(f"Erro ao remover arquivo temporário {file_path}: {e}")
+                except OSError as e:
+                    failures.append(f"{entry.path}: {e}")
+        
+        if failures:
+            logger.warning(f"Erro ao remover {len(failures)} arquivo(s) temporário(s): "
+                           + "; ".join(failures))
         
         if total_cleaned > 0:
             logger.info(f"Limpeza em lote concluída: {total_cleaned} arquivos temporários removidos")
 
+    def _individual_transcription_path(self, filepath: str) -> str:
+        """Caminho da transcrição individual, ao lado do arquivo original."""
+        base_name = os.path.splitext(self._file_name(filepath))[0]
+        return os.path.join(os.path.dirname(filepath), f"{base_name}_transcricao.txt")
+    
+    def _write_individual_header(self, f, filepath: str) -> None:
+        """Escreve o cabeçalho da transcrição individual."""
+        f.write(f"Transcrição de: {self._file_name(filepath)}\n")
+        f.write(f"Gerado em: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write("=" * 60 + "\n\n")
+    
     def _save_individual_transcription(self, filepath: str, transcription_text: str):
-        """Salva transcrição individual com nome baseado no arquivo original."""
+        """Agenda a gravação da transcrição individual e retorna o caminho do arquivo.
+        
+        A escrita é feita pela thread de gravação, fora do caminho da inferência.
+        """
         if not transcription_text.strip():
             return None
             
         # Gera nome do arquivo de transcrição baseado no arquivo original
-        base_name = os.path.splitext(os.path.basename(filepath))[0]
-        transcription_filename = f"{base_name}_transcricao.txt"
-        output_dir = os.path.dirname(filepath)
-        transcription_path = os.path.join(output_dir, transcription_filename)
-        
+        transcription_path = self._individual_transcription_path(filepath)
+        if self._writer_closed:
+            # A thread de gravação já terminou: grava diretamente
+            self._write_individual_file(transcription_path, filepath,
+                                        transcription_text)
+        else:
+            self._write_queue.put((transcription_path, filepath, transcription_text))
+        return transcription_path
+    
+    def _write_individual_file(self, transcription_path: str, filepath: str,
+                               transcription_text: str) -> None:
+        """Grava a transcrição em arquivo temporário e renomeia (nunca truncada)."""
+        tmp_path = transcription_path + ".tmp"
         try:
-            with open(transcription_path, "w", encoding="utf-8") as f:
-                f.write(f"Transcrição de: {os.path.basename(filepath)}\n")
-                f.write(f"Gerado em: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 60 + "\n\n")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                self._write_individual_header(f, filepath)
                 f.write(transcription_text)
+            os.replace(tmp_path, transcription_path)
             
             logger.info(f"Transcrição individual salva: {transcription_path}")
-            return transcription_path
         except Exception as e:
             logger.error(f"Erro ao salvar transcrição individual: {e}")
-            return None
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def _writer_loop(self) -> None:
+        """Thread de gravação: escreve as transcrições individuais enfileiradas."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            self._write_individual_file(*item)
+    
+    def _stop_writer(self) -> None:
+        """Espera a thread de gravação terminar as transcrições pendentes.
+        
+        Chamado apenas pela thread de run(), a mesma que enfileira as gravações.
+        """
+        if self._writer_closed:
+            return
+        self._writer_closed = True
+        self._write_queue.put(None)
+        self._writer.join()
 
     def stop(self):
         """Stop the batch transcription process."""
         self._is_running = False
+        # The writer is stopped by run() itself, once no more files can be queued
         # Limpeza de chunks e arquivos temporários
         self._cleanup_chunks_and_temp_files()
         self.quit()
-        self.wait()
\ No newline at end of file
+        self.wait()
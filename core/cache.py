@@ -1,17 +1,70 @@
 """Advanced cache system for audio metadata, models, and features optimization."""
 
-import os
-import json
-import time
-import pickle
+import atexit
 import hashlib
+import json
+import os
+import sys
 import tempfile
-import weakref
-from typing import Dict, Optional, Any, Union, List
-from dataclasses import dataclass, asdict
-from pathlib import Path
 import threading
-import psutil
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STALE_CHECK_WORKERS = 16  # Threads used to stat cached paths in clear_stale_entries
+TRANSCRIPTION_CACHE_MAX_ENTRIES = 1000  # Oldest transcriptions are dropped beyond this
+
+# Rough memory estimate (MB) per cached model size
+_MODEL_SIZE_MB = {
+    "tiny": 200,
+    "base": 400,
+    "small": 800,
+    "medium": 1500,
+    "large": 3000,
+    "large-v2": 3000,
+    "large-v3": 3000,
+}
+
+
+def _read_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: str, data: Any, indent: bool = False) -> None:
+    """Write data as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize data as a single UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def _parse_json_line(line: bytes) -> Any:
+    """Parse one JSON line read in binary mode."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
 
 
 @dataclass
@@ -24,7 +77,7 @@ class AudioFileInfo:
     cached_at: float
 
 
-@dataclass 
+@dataclass
 class ModelCacheInfo:
     """Stores metadata about cached models."""
     model_key: str
@@ -39,46 +92,195 @@ class ModelCacheInfo:
     access_count: int
 
 
+# Live caches flushed at interpreter exit; weak, so registering does not keep them alive
+_FLUSH_AT_EXIT: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_caches_at_exit() -> None:
+    """Flush every cache still alive when the interpreter exits."""
+    for cache in list(_FLUSH_AT_EXIT):
+        cache.flush()
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Return os.stat() for path, or None if it cannot be read."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 class FileCache:
     """Cache system for file metadata to avoid repeated FFmpeg calls."""
     
-    def __init__(self, cache_file: str = ".vox_file_cache.json"):
+    def __init__(self, cache_file: str = ".vox_file_cache.ndjson",
+                 transcription_cache_file: str = ".vox_transcription_cache.ndjson"):
         self.cache_file = cache_file
+        self._legacy_cache_file = os.path.splitext(cache_file)[0] + ".json"
+        self.transcription_cache_file = transcription_cache_file
+        self._legacy_transcription_cache_file = os.path.splitext(transcription_cache_file)[0] + ".json"
         self.cache: Dict[str, AudioFileInfo] = {}
+        # Oldest first; bounded to TRANSCRIPTION_CACHE_MAX_ENTRIES
+        self.transcriptions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Rows in cache_file; each set_duration appends one until the file is compacted
+        self._log_lines = 0
+        # Same for transcription_cache_file and set_transcription
+        self._transcription_log_lines = 0
+        # Guards transcriptions and its log: prefetch threads read while the run thread writes
+        self._transcription_lock = threading.RLock()
         self.load_cache()
+        _FLUSH_AT_EXIT.add(self)
     
     def load_cache(self) -> None:
         """Load cache from disk."""
         try:
             if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    for filepath, data in cache_data.items():
-                        self.cache[filepath] = AudioFileInfo(**data)
+                # Append-only log: later rows for a file override earlier ones
+                corrupt_rows = False
+                with open(self.cache_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            data = _parse_json_line(line)
+                        except ValueError:
+                            corrupt_rows = True  # Row truncated by an interrupted append
+                            continue
+                        self.cache[data['filepath']] = AudioFileInfo(**data)
+                        self._log_lines += 1
+                if corrupt_rows:
+                    self.compact()
+            elif (self._legacy_cache_file != self.cache_file and
+                  os.path.exists(self._legacy_cache_file)):
+                # One-time migration from the old single-document JSON cache
+                cache_data = _read_json(self._legacy_cache_file)
+                for filepath, data in cache_data.items():
+                    self.cache[filepath] = AudioFileInfo(**data)
+                self.compact()
+                os.remove(self._legacy_cache_file)
         except Exception as e:
             print(f"Warning: Could not load cache file: {e}")
             self.cache = {}
+        
+        try:
+            self._load_transcriptions()
+        except Exception as e:
+            print(f"Warning: Could not load transcription cache file: {e}")
+            self.transcriptions = OrderedDict()
+    
+    def _load_transcriptions(self) -> None:
+        """Load the transcription log; later rows for a key override earlier ones."""
+        if os.path.exists(self.transcription_cache_file):
+            corrupt_rows = False
+            with open(self.transcription_cache_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        row = _parse_json_line(line)
+                    except ValueError:
+                        corrupt_rows = True  # Row truncated by an interrupted append
+                        continue
+                    self._remember_transcription(row['key'], row['data'])
+                    self._transcription_log_lines += 1
+            if corrupt_rows:
+                self.compact_transcriptions()
+        elif (self._legacy_transcription_cache_file != self.transcription_cache_file and
+              os.path.exists(self._legacy_transcription_cache_file)):
+            # One-time migration from the old single-document JSON cache
+            for key, data in _read_json(self._legacy_transcription_cache_file).items():
+                self._remember_transcription(key, data)
+            self.compact_transcriptions()
+            os.remove(self._legacy_transcription_cache_file)
     
     def save_cache(self) -> None:
         """Save cache to disk."""
+        self.compact()
+    
+    def compact(self) -> None:
+        """Rewrite the cache file with one row per cached file."""
         try:
-            cache_data = {filepath: asdict(info) for filepath, info in self.cache.items()}
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            tmp_path = self.cache_file + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                for info in self.cache.values():
+                    f.write(_json_line(info.__dict__))
+            os.replace(tmp_path, self.cache_file)
+            self._log_lines = len(self.cache)
         except Exception as e:
             print(f"Warning: Could not save cache file: {e}")
     
+    def _append_entry(self, info: AudioFileInfo) -> None:
+        """Append one cache row to disk."""
+        try:
+            with open(self.cache_file, 'ab') as f:
+                f.write(_json_line(info.__dict__))
+            self._log_lines += 1
+        except Exception as e:
+            print(f"Warning: Could not save cache file: {e}")
+    
+    def flush(self) -> None:
+        """Compact the cache files once superseded rows outnumber live ones."""
+        if self._log_lines > 2 * len(self.cache):
+            self.compact()
+        with self._transcription_lock:
+            if self._transcription_log_lines > 2 * len(self.transcriptions):
+                self.compact_transcriptions()
+    
+    def save_transcriptions(self) -> None:
+        """Save transcription cache to disk."""
+        self.compact_transcriptions()
+    
+    def compact_transcriptions(self) -> None:
+        """Rewrite the transcription cache file with one row per cached transcription."""
+        try:
+            tmp_path = self.transcription_cache_file + ".tmp"
+            with self._transcription_lock:
+                with open(tmp_path, 'wb') as f:
+                    for key, data in self.transcriptions.items():
+                        f.write(_json_line({'key': key, 'data': data}))
+                os.replace(tmp_path, self.transcription_cache_file)
+                self._transcription_log_lines = len(self.transcriptions)
+        except Exception as e:
+            print(f"Warning: Could not save transcription cache file: {e}")
+    
+    def _remember_transcription(self, key: str, data: Dict[str, Any]) -> None:
+        """Store a transcription in memory as the newest entry, evicting the oldest."""
+        self.transcriptions[key] = data
+        self.transcriptions.move_to_end(key)
+        while len(self.transcriptions) > TRANSCRIPTION_CACHE_MAX_ENTRIES:
+            self.transcriptions.popitem(last=False)
+    
+    def get_transcription(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached transcription by content/settings key."""
+        with self._transcription_lock:
+            return self.transcriptions.get(key)
+    
+    def set_transcription(self, key: str, data: Dict[str, Any]) -> None:
+        """Cache a transcription by content/settings key, appending one row to disk."""
+        with self._transcription_lock:
+            self._remember_transcription(key, data)
+            try:
+                with open(self.transcription_cache_file, 'ab') as f:
+                    f.write(_json_line({'key': key, 'data': data}))
+                self._transcription_log_lines += 1
+            except Exception as e:
+                print(f"Warning: Could not save transcription cache file: {e}")
+            # Evicted and superseded rows stay in the log until it is compacted
+            if self._transcription_log_lines > 2 * TRANSCRIPTION_CACHE_MAX_ENTRIES:
+                self.compact_transcriptions()
+    
     def get_duration(self, filepath: str) -> Optional[float]:
         """Get cached duration for a file."""
-        if not os.path.exists(filepath):
+        file_stat = _stat_or_none(filepath)
+        if file_stat is None:
             return None
-            
-        file_stat = os.stat(filepath)
+        
         cache_info = self.cache.get(filepath)
         
         # Check if cache is valid (file hasn't changed)
-        if (cache_info and 
-            cache_info.size == file_stat.st_size and 
+        if (cache_info and
+            cache_info.size == file_stat.st_size and
             abs(cache_info.mtime - file_stat.st_mtime) < 1.0):
             return cache_info.duration
         
@@ -86,42 +288,54 @@ class FileCache:
     
     def set_duration(self, filepath: str, duration: float) -> None:
         """Cache duration for a file."""
-        if not os.path.exists(filepath):
+        file_stat = _stat_or_none(filepath)
+        if file_stat is None:
             return
-            
-        file_stat = os.stat(filepath)
-        self.cache[filepath] = AudioFileInfo(
+        
+        info = AudioFileInfo(
             filepath=filepath,
             duration=duration,
             size=file_stat.st_size,
             mtime=file_stat.st_mtime,
             cached_at=time.time()
         )
-        self.save_cache()
+        self.cache[filepath] = info
+        self._append_entry(info)
     
     def clear_stale_entries(self, max_age_hours: int = 24) -> None:
         """Remove stale cache entries."""
         current_time = time.time()
         max_age_seconds = max_age_hours * 3600
         
+        # Remove if cache is too old or file doesn't exist
         stale_keys = []
+        to_check = []
         for filepath, info in self.cache.items():
-            # Remove if file doesn't exist or cache is too old
-            if (not os.path.exists(filepath) or 
-                current_time - info.cached_at > max_age_seconds):
+            if current_time - info.cached_at > max_age_seconds:
                 stale_keys.append(filepath)
+            else:
+                to_check.append(filepath)
+        
+        # Existence checks are latency-bound (network drives), so overlap them
+        if to_check:
+            with ThreadPoolExecutor(max_workers=min(STALE_CHECK_WORKERS, len(to_check))) as pool:
+                for filepath, file_stat in zip(to_check, pool.map(_stat_or_none, to_check)):
+                    if file_stat is None:
+                        stale_keys.append(filepath)
         
         for key in stale_keys:
             del self.cache[key]
         
         if stale_keys:
-            self.save_cache()
+            self.compact()
             print(f"Cleared {len(stale_keys)} stale cache entries")
 
 
 class IntelligentModelCache:
     """Advanced caching system for WhisperModel instances and features."""
     
+    ACCESS_FLUSH_THRESHOLD = 64
+    
     def __init__(self, cache_dir: Optional[str] = None, max_memory_mb: int = 4096):
         self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "vox_model_cache")
         self.max_memory_mb = max_memory_mb
@@ -129,9 +343,18 @@ class IntelligentModelCache:
         
         # Thread-safe model cache using weak references
         self._model_cache: Dict[str, Any] = {}
-        self._model_refs: Dict[str, weakref.ref] = {}
-        self._cache_info: Dict[str, ModelCacheInfo] = {}
-        self._lock = threading.RLock()
+        self._model_refs: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+        # Kept in LRU order: least recently used first
+        self._cache_info: "OrderedDict[str, ModelCacheInfo]" = OrderedDict()
+        # _model_lock guards _model_cache/_model_refs; _meta_lock guards _cache_info
+        # and disk I/O. Lock order: _meta_lock may be held while taking _model_lock,
+        # never the other way round.
+        self._model_lock = threading.RLock()
+        self._meta_lock = threading.RLock()
+        # Model configuration tuple -> hex key, so each key is hashed once
+        self._key_cache: Dict[tuple, str] = {}
+        # Access stats are only persisted every ACCESS_FLUSH_THRESHOLD hits
+        self._access_dirty_count = 0
         
         # Feature cache for preprocessed audio
         self._feature_cache: Dict[str, Any] = {}
@@ -139,6 +362,7 @@ class IntelligentModelCache:
         
         self._ensure_cache_dir()
         self._load_cache_info()
+        _FLUSH_AT_EXIT.add(self)
     
     def _ensure_cache_dir(self) -> None:
         """Ensure cache directory exists."""
@@ -147,98 +371,91 @@ class IntelligentModelCache:
     def _load_cache_info(self) -> None:
         """Load cache metadata from disk."""
         try:
-            if os.path.exists(self.cache_info_file):
-                with open(self.cache_info_file, 'r') as f:
-                    cache_data = json.load(f)
-                    for key, data in cache_data.items():
-                        self._cache_info[key] = ModelCacheInfo(**data)
+            # JSON, never pickle: the default cache dir lives under the shared temp dir
+            cache_data = _read_json(self.cache_info_file) if os.path.exists(self.cache_info_file) else {}
+            for key, data in sorted(cache_data.items(), key=lambda x: x[1]['last_accessed']):
+                # Only a handful of distinct values: share one string object each
+                for field in ('model_size', 'device', 'compute_type'):
+                    if isinstance(data[field], str):  # May be null, e.g. an unset compute type
+                        data[field] = sys.intern(data[field])
+                self._cache_info[key] = ModelCacheInfo(**data)
         except Exception as e:
             print(f"Warning: Could not load model cache info: {e}")
-            self._cache_info = {}
+            self._cache_info = OrderedDict()
     
     def _save_cache_info(self) -> None:
         """Save cache metadata to disk."""
         try:
-            cache_data = {key: asdict(info) for key, info in self._cache_info.items()}
-            with open(self.cache_info_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            cache_data = {key: info.__dict__ for key, info in self._cache_info.items()}
+            _write_json(self.cache_info_file, cache_data)
+            self._access_dirty_count = 0
         except Exception as e:
             print(f"Warning: Could not save model cache info: {e}")
     
+    def flush(self) -> None:
+        """Persist access statistics that have not been written yet."""
+        with self._meta_lock:
+            if self._access_dirty_count:
+                self._save_cache_info()
+    
     def _generate_model_key(self, model_size: str, device: str, compute_type: str, **kwargs) -> str:
         """Generate a unique key for model configuration."""
-        config_str = f"{model_size}_{device}_{compute_type}"
-        for key, value in sorted(kwargs.items()):
-            config_str += f"_{key}_{value}"
-        return hashlib.md5(config_str.encode()).hexdigest()[:12]
+        config = (model_size, device, compute_type, tuple(sorted(kwargs.items())))
+        model_key = self._key_cache.get(config)
+        if model_key is None:
+            config_str = "|".join(map(str, config))
+            model_key = hashlib.blake2b(config_str.encode(), digest_size=6).hexdigest()
+            self._key_cache[config] = model_key
+        return model_key
     
     def get_cached_model(self, model_size: str, device: str, compute_type: str, **kwargs):
         """Get a cached model instance or None if not cached."""
         model_key = self._generate_model_key(model_size, device, compute_type, **kwargs)
         
-        with self._lock:
+        with self._model_lock:
             # Check if model is in memory cache
-            if model_key in self._model_cache:
-                model = self._model_cache[model_key]
-                if model is not None:
-                    # Update access info
-                    if model_key in self._cache_info:
-                        self._cache_info[model_key].last_accessed = time.time()
-                        self._cache_info[model_key].access_count += 1
-                        self._save_cache_info()
-                    return model
-            
-            # Check weak references
-            if model_key in self._model_refs:
-                model = self._model_refs[model_key]()
+            model = self._model_cache.get(model_key)
+            if model is None:
+                # Check weak references (dead entries drop out on their own)
+                model = self._model_refs.get(model_key)
                 if model is not None:
                     self._model_cache[model_key] = model
-                    return model
-                else:
-                    # Clean up dead reference
-                    del self._model_refs[model_key]
+                return model
         
-        return None
+        # Update access info outside the model lock
+        with self._meta_lock:
+            if model_key in self._cache_info:
+                self._cache_info[model_key].last_accessed = time.time()
+                self._cache_info[model_key].access_count += 1
+                self._cache_info.move_to_end(model_key)
+                self._access_dirty_count += 1
+                if self._access_dirty_count >= self.ACCESS_FLUSH_THRESHOLD:
+                    self._save_cache_info()
+        return model
     
-    def cache_model(self, model, model_size: str, device: str, compute_type: str, 
+    def cache_model(self, model, model_size: str, device: str, compute_type: str,
                    load_time: float = 0, **kwargs) -> str:
         """Cache a model instance."""
         model_key = self._generate_model_key(model_size, device, compute_type, **kwargs)
         current_time = time.time()
         
-        with self._lock:
-            # Store in memory cache
+        with self._model_lock:
+            # Store in memory cache, plus a weak entry for automatic cleanup
             self._model_cache[model_key] = model
-            
-            # Create weak reference for automatic cleanup
-            def cleanup_callback(ref):
-                with self._lock:
-                    if model_key in self._model_refs and self._model_refs[model_key] is ref:
-                        del self._model_refs[model_key]
-            
-            self._model_refs[model_key] = weakref.ref(model, cleanup_callback)
-            
+            self._model_refs[model_key] = model
+        
+        with self._meta_lock:
             # Estimate memory usage (rough approximation)
-            memory_usage = 0
-            if model_size == "tiny":
-                memory_usage = 200
-            elif model_size == "base":
-                memory_usage = 400
-            elif model_size == "small":
-                memory_usage = 800
-            elif model_size == "medium":
-                memory_usage = 1500
-            elif model_size in ["large", "large-v2", "large-v3"]:
-                memory_usage = 3000
+            memory_usage = _MODEL_SIZE_MB.get(model_size, 0)
             
             # Create cache info
             cache_path = os.path.join(self.cache_dir, f"model_{model_key}.pkl")
             
             self._cache_info[model_key] = ModelCacheInfo(
                 model_key=model_key,
-                model_size=model_size,
-                device=device,
-                compute_type=compute_type,
+                model_size=sys.intern(model_size),
+                device=sys.intern(device),
+                compute_type=sys.intern(compute_type),
                 cache_path=cache_path,
                 memory_usage_mb=memory_usage,
                 load_time=load_time,
@@ -246,6 +463,7 @@ class IntelligentModelCache:
                 last_accessed=current_time,
                 access_count=1
             )
+            self._cache_info.move_to_end(model_key)
             
             self._save_cache_info()
             
@@ -258,31 +476,20 @@ class IntelligentModelCache:
         """Manage memory usage by removing least recently used models."""
         total_usage = sum(info.memory_usage_mb for info in self._cache_info.values())
         
-        if total_usage > self.max_memory_mb:
-            # Sort by last accessed time (LRU)
-            sorted_models = sorted(
-                self._cache_info.items(),
-                key=lambda x: x[1].last_accessed
-            )
-            
-            # Remove oldest models until under memory limit
-            for model_key, info in sorted_models:
-                if total_usage <= self.max_memory_mb:
-                    break
-                
-                self._remove_cached_model(model_key)
-                total_usage -= info.memory_usage_mb
-                print(f"🧹 Removed cached model {info.model_size} to free memory")
+        # _cache_info is in LRU order, so evict from the front until under the limit
+        while total_usage > self.max_memory_mb and self._cache_info:
+            model_key, info = next(iter(self._cache_info.items()))
+            self._remove_cached_model(model_key)
+            total_usage -= info.memory_usage_mb
+            print(f"🧹 Removed cached model {info.model_size} to free memory")
     
     def _remove_cached_model(self, model_key: str) -> None:
         """Remove a model from cache."""
-        with self._lock:
+        with self._meta_lock:
             # Remove from memory cache
-            if model_key in self._model_cache:
-                del self._model_cache[model_key]
-            
-            if model_key in self._model_refs:
-                del self._model_refs[model_key]
+            with self._model_lock:
+                self._model_cache.pop(model_key, None)
+                self._model_refs.pop(model_key, None)
             
             # Remove cache info
             if model_key in self._cache_info:
@@ -299,7 +506,7 @@ class IntelligentModelCache:
     
     def get_cache_statistics(self) -> Dict[str, Any]:
         """Get comprehensive cache statistics."""
-        with self._lock:
+        with self._meta_lock:
             total_models = len(self._cache_info)
             total_memory_mb = sum(info.memory_usage_mb for info in self._cache_info.values())
             total_features = len(self._feature_cache)
@@ -324,9 +531,10 @@ class IntelligentModelCache:
     
     def clear_cache(self, clear_disk: bool = True) -> None:
         """Clear all cached data."""
-        with self._lock:
-            self._model_cache.clear()
-            self._model_refs.clear()
+        with self._meta_lock:
+            with self._model_lock:
+                self._model_cache.clear()
+                self._model_refs.clear()
             self._feature_cache.clear()
             
             if clear_disk:
@@ -352,4 +560,4 @@ def get_model_cache() -> IntelligentModelCache:
     global _global_model_cache
     if _global_model_cache is None:
         _global_model_cache = IntelligentModelCache()
-    return _global_model_cache
\ No newline at end of file
+    return _global_model_cache
@@ -1,23 +1,101 @@
 """Popup de conclusão com informações detalhadas de desempenho."""
 
+import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Optional
 
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QPixmap, QIcon
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QTextEdit, QFrame, QScrollArea, QWidget, QGridLayout
+    QDialog,
+    QFrame,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QScrollArea,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class CompletionPopup(QDialog):
     """Popup informativo de conclusão com métricas de performance detalhadas."""
     
+    # Folhas de estilo fixas, definidas uma única vez para todas as instâncias
+    _MAIN_QSS = """
+        QDialog {
+            background-color: #3c3c3c;
+            border: 1px solid #555;
+            color: #f0f0f0;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }
+        QLabel {
+            color: #d0d0d0;
+        }
+        QTextEdit {
+            border: 1px solid #555;
+            border-radius: 4px;
+            background-color: #3c3c3c;
+            color: #f0f0f0;
+            font-family: 'Consolas', 'Monaco', monospace;
+            font-size: 11px;
+            padding: 8px;
+        }
+        QScrollArea {
+            border: none;
+            background-color: #3c3c3c;
+        }
+        QFrame[frameShape="4"] {
+            color: #555;
+        }
+    """
+    
+    _REPORT_BTN_QSS = """
+        QPushButton {
+            background-color: #0078d7;
+            color: #f0f0f0;
+            border: 1px solid #0078d7;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: 500;
+            min-width: 100px;
+        }
+        QPushButton:hover {
+            background-color: #106ebe;
+            border: 1px solid #106ebe;
+        }
+        QPushButton:pressed {
+            background-color: #005a9e;
+        }
+    """
+    
+    _OK_BTN_QSS = """
+        QPushButton {
+            background-color: #5c5c5c;
+            color: #f0f0f0;
+            border: 1px solid #666;
+            padding: 8px 20px;
+            border-radius: 4px;
+            font-weight: 500;
+            min-width: 60px;
+        }
+        QPushButton:hover {
+            background-color: #6c6c6c;
+            border: 1px solid #777;
+        }
+        QPushButton:pressed {
+            background-color: #4c4c4c;
+        }
+    """
+    
     def __init__(self, performance_data: Dict[str, Any], parent=None):
         super().__init__(parent)
         self.performance_data = performance_data
+        self._details_populated = False
         self.init_ui()
         
         # Auto-close timer (optional)
@@ -142,21 +220,24 @@ class CompletionPopup(QDialog):
         details_widget = QWidget()
         details_layout = QVBoxLayout()
         
-        # Texto detalhado
-        details_text = QTextEdit()
-        details_text.setReadOnly(True)
-        details_text.setMaximumHeight(180)
-        
-        # Gera conteúdo detalhado
-        details_content = self._generate_details_content()
-        details_text.setPlainText(details_content)
+        # Texto detalhado (preenchido na primeira exibição, ver showEvent)
+        self.details_text = QTextEdit()
+        self.details_text.setReadOnly(True)
+        self.details_text.setMaximumHeight(180)
         
-        details_layout.addWidget(details_text)
+        details_layout.addWidget(self.details_text)
         details_widget.setLayout(details_layout)
         scroll_area.setWidget(details_widget)
         
         return scroll_area
     
+    def showEvent(self, event):
+        """Gera o conteúdo detalhado somente quando o popup é exibido."""
+        if not self._details_populated:
+            self.details_text.setPlainText(self._generate_details_content())
+            self._details_populated = True
+        super().showEvent(event)
+    
     def _create_buttons(self) -> QHBoxLayout:
         """Cria botões de ação."""
         buttons_layout = QHBoxLayout()
@@ -165,48 +246,14 @@ class CompletionPopup(QDialog):
         # Botão para visualizar relatório completo
         view_report_btn = QPushButton("📄 Ver Relatório Completo")
         view_report_btn.clicked.connect(self._show_full_report)
-        view_report_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d7;
-                color: #f0f0f0;
-                border: 1px solid #0078d7;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: 500;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-                border: 1px solid #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-        """)
+        view_report_btn.setStyleSheet(self._REPORT_BTN_QSS)
         buttons_layout.addWidget(view_report_btn)
         
         # Botão OK
         ok_button = QPushButton("OK")
         ok_button.clicked.connect(self.accept)
         ok_button.setDefault(True)
-        ok_button.setStyleSheet("""
-            QPushButton {
-                background-color: #5c5c5c;
-                color: #f0f0f0;
-                border: 1px solid #666;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: 500;
-                min-width: 60px;
-            }
-            QPushButton:hover {
-                background-color: #6c6c6c;
-                border: 1px solid #777;
-            }
-            QPushButton:pressed {
-                background-color: #4c4c4c;
-            }
-        """)
+        ok_button.setStyleSheet(self._OK_BTN_QSS)
         buttons_layout.addWidget(ok_button)
         
         return buttons_layout
@@ -215,9 +262,6 @@ class CompletionPopup(QDialog):
         """Gera conteúdo detalhado para a seção de informações."""
         lines = []
         
-        # Debug: Print available keys
-        print(f"DEBUG: Performance data keys: {list(self.performance_data.keys())}")
-        
         # Informações de timing
         start_time = self.performance_data.get('start_time', 'N/A')
         end_time = self.performance_data.get('end_time', 'N/A')
@@ -249,12 +293,11 @@ class CompletionPopup(QDialog):
         if speedup > 1:
             lines.append(f"🚀 Speedup por Paralelização: {speedup:.1f}x")
         
-        # Configuration summary - with debug
+        # Configuration summary
         model = self.performance_data.get('model_size', 'N/A')
         device = self.performance_data.get('device', 'N/A')
         compute_type = self.performance_data.get('compute_type', 'N/A')
-        
-        print(f"DEBUG: Model: {model}, Device: {device}, Compute: {compute_type}")
+        logger.debug("Completion popup: model=%s device=%s compute=%s", model, device, compute_type)
         
         lines.append(f"⚙️ Modelo: {model} | Dispositivo: {device}")
         if compute_type != 'N/A':
@@ -283,42 +326,50 @@ class CompletionPopup(QDialog):
     
     def _apply_styles(self):
         """Aplica estilos gerais ao popup seguindo o tema da aplicação."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #3c3c3c;
-                border: 1px solid #555;
-                color: #f0f0f0;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QLabel {
-                color: #d0d0d0;
-            }
-            QTextEdit {
-                border: 1px solid #555;
-                border-radius: 4px;
-                background-color: #3c3c3c;
-                color: #f0f0f0;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 11px;
-                padding: 8px;
-            }
-            QScrollArea {
-                border: none;
-                background-color: #3c3c3c;
-            }
-            QFrame[frameShape="4"] {
-                color: #555;
-            }
-        """)
+        self.setStyleSheet(self._MAIN_QSS)
+    
+    def _load_full_report(self) -> str:
+        """Lê o relatório completo do disco (ou usa o texto embutido, se houver).
+        
+        'full_report' pode ser o texto ou uma função que o carrega sob demanda.
+        """
+        report_path = self.performance_data.get('report_path')
+        if report_path:
+            try:
+                with open(report_path, "r", encoding="utf-8") as f:
+                    return f.read()
+            except OSError:
+                pass
+        full_report = self.performance_data.get('full_report')
+        if callable(full_report):
+            full_report = full_report()
+        return str(full_report
+                   or self.performance_data.get('full_report_preview')
+                   or 'Relatório completo não disponível.')
     
     def _show_full_report(self):
         """Exibe o relatório completo em uma nova janela."""
-        full_report = self.performance_data.get('full_report', 'Relatório completo não disponível.')
+        full_report = self._load_full_report()
         
         from .report_viewer import ReportViewerDialog
         report_dialog = ReportViewerDialog(full_report, self)
         report_dialog.exec_()
     
+    def done(self, result):
+        """Fecha o popup e apaga o relatório temporário, que só existe para ele."""
+        self._discard_report_file(self.performance_data)
+        super().done(result)
+    
+    @staticmethod
+    def _discard_report_file(performance_data: Dict[str, Any]) -> None:
+        """Remove o arquivo do relatório completo, se ainda existir."""
+        report_path = performance_data.pop('report_path', None)
+        if report_path:
+            try:
+                os.remove(report_path)
+            except OSError as e:
+                logger.debug(f"Relatório temporário não removido: {e}")
+    
     def show_with_auto_close(self, timeout_seconds: int = 10):
         """Exibe o popup com fechamento automático opcional."""
         self.auto_close_timer.start(timeout_seconds * 1000)
@@ -327,11 +378,18 @@ class CompletionPopup(QDialog):
     @staticmethod
     def show_completion_popup(performance_data: Dict[str, Any], parent=None, auto_close: Optional[int] = None):
         """Método estático para exibir popup de conclusão."""
-        popup = CompletionPopup(performance_data, parent)
+        try:
+            popup = CompletionPopup(performance_data, parent)
+        except Exception:
+            # Sem popup, ninguém mais vai ler o relatório
+            CompletionPopup._discard_report_file(performance_data)
+            raise
         
         if auto_close:
+            # done() remove o relatório quando o popup fecha
             popup.show_with_auto_close(auto_close)
         else:
             popup.exec_()
+            CompletionPopup._discard_report_file(performance_data)
         
-        return popup
\ No newline at end of file
+        return popup
@@ -1,13 +1,58 @@
 """Configuration management for VoxSynopsis."""
 
+import copy
 import json
 import os
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _detect_cpu_count() -> int:
+    """CPUs disponíveis para o processo (respeita taskset/cgroups quando possível)."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
 # Global constants
 SAMPLE_RATE = 48000
 OUTPUT_DIR = "gravacoes"
-MAX_WORKERS = min(4, (os.cpu_count() or 1) + 1)  # Limite de workers para threads
+CPU_COUNT = _detect_cpu_count()
+MAX_WORKERS = min(4, CPU_COUNT + 1)  # Limite de workers para threads
+
+
+def _build_default_settings() -> dict[str, Any]:
+    """Configurações padrão (avaliadas uma vez, em _DEFAULT_SETTINGS)."""
+    return {
+        "model_size": "base",
+        "device": "auto",  # CUDA when available, otherwise CPU
+        "compute_type": "auto",  # Fastest type CTranslate2 supports on the device
+        "vad_filter": True,
+        "vad_threshold": 0.5,
+        "vad_min_speech_duration_ms": 250,
+        "vad_max_speech_duration_s": 30,
+        "vad_min_silence_duration_ms": 2000,
+        "vad_speech_pad_ms": 400,
+        "language": "pt",
+        "temperature": 0.0,
+        "beam_size": 1,                    # Otimizado: 5 → 1 (5x menos computação)
+        "best_of": 1,                      # Otimizado: 5 → 1 (5x menos tentativas)
+        "condition_on_previous_text": False, # Otimizado: processamento mais rápido
+        "patience": 1.0,
+        "parallel_processes": min(2, CPU_COUNT // 2),
+        "cpu_threads": CPU_COUNT // 2,
+        "chunk_duration_seconds": 60,
+    }
+
+
+# Somente leitura: cada ConfigManager recebe sua própria cópia
+_DEFAULT_SETTINGS = MappingProxyType(_build_default_settings())
 
 
 class ConfigManager:
@@ -15,45 +60,42 @@ class ConfigManager:
     
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
-        self.default_settings = {
-            "model_size": "base",
-            "device": "cpu",
-            "compute_type": "int8",
-            "vad_filter": True,
-            "vad_threshold": 0.5,
-            "vad_min_speech_duration_ms": 250,
-            "vad_max_speech_duration_s": 30,
-            "vad_min_silence_duration_ms": 2000,
-            "vad_speech_pad_ms": 400,
-            "language": "pt",
-            "temperature": 0.0,
-            "beam_size": 1,                    # Otimizado: 5 → 1 (5x menos computação)
-            "best_of": 1,                      # Otimizado: 5 → 1 (5x menos tentativas)
-            "condition_on_previous_text": False, # Otimizado: processamento mais rápido
-            "patience": 1.0,
-            "parallel_processes": min(2, (os.cpu_count() or 1) // 2),
-            "cpu_threads": (os.cpu_count() or 1) // 2,
-            "chunk_duration_seconds": 60,
-        }
+        # Cópia do que está no disco (lido ou gravado por último); None força a primeira gravação
+        self._saved_settings: dict[str, Any] | None = None
         self.settings = self.load_settings()
     
     def load_settings(self) -> dict[str, Any]:
         """Carrega configurações do arquivo"""
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                settings = json.load(f)
-                # Garante que todas as chaves padrão existam
-                for key, value in self.default_settings.items():
-                    if key not in settings:
-                        settings[key] = value
-                return settings
+            with open(self.config_file, "rb") as f:
+                data = f.read()
+                settings = orjson.loads(data) if orjson is not None else json.loads(data)
+                self._saved_settings = copy.deepcopy(settings)
+                # Garante que todas as chaves padrão existam (valores do arquivo prevalecem)
+                return _DEFAULT_SETTINGS | settings
         except FileNotFoundError:
-            return self.default_settings.copy()
+            return dict(_DEFAULT_SETTINGS)
     
     def save_settings(self) -> None:
-        """Salva configurações no arquivo"""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(self.settings, f, indent=2, ensure_ascii=False)
+        """Salva configurações no arquivo (de forma atômica, só se houve mudança)"""
+        if self.settings == self._saved_settings:
+            return
+        
+        tmp_path = self.config_file + ".tmp"
+        try:
+            if orjson is not None:
+                with open(tmp_path, "wb") as f:
+                    f.write(orjson.dumps(self.settings,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.config_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._saved_settings = copy.deepcopy(self.settings)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Obtém valor de configuração"""
@@ -68,10 +110,21 @@ class ConfigManager:
         return self.settings.copy()
 
 
+# Caminho absoluto -> (mtime, conteúdo) do stylesheet já lido
+_STYLESHEET_CACHE: dict[str, tuple[float, str]] = {}
+
+
 def load_stylesheet(app: Any) -> None:
-    """Carrega o stylesheet da aplicação"""
+    """Carrega o stylesheet da aplicação (relido apenas se o arquivo mudar)"""
+    path = os.path.abspath("style.qss")
     try:
-        with open("style.qss", "r") as f:
-            app.setStyleSheet(f.read())
+        mtime = os.stat(path).st_mtime
+        cached = _STYLESHEET_CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = (mtime, f.read())
+            _STYLESHEET_CACHE[path] = cached
     except FileNotFoundError:
-        print("Arquivo style.qss não encontrado. Usando estilo padrão.")
\ No newline at end of file
+        print("Arquivo style.qss não encontrado. Usando estilo padrão.")
+        return
+    app.setStyleSheet(cached[1])
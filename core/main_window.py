@@ -1,9 +1,7 @@
 """Main window application class."""
 
-import json
 import os
 import time
-from typing import Any
 
 import psutil
 import sounddevice as sd
@@ -13,11 +11,11 @@ from PyQt5.QtWidgets import QApplication, QFileDialog, QMainWindow, QMessageBox
 
 from ui_vox_synopsis import Ui_MainWindow
 
+from .completion_popup import CompletionPopup
 from .config import OUTPUT_DIR, ConfigManager
-from .recording import RecordingThread, DeviceInfo
-from .transcription import TranscriptionThread
+from .recording import RecordingThread
 from .settings_dialog import FastWhisperSettingsDialog
-from .completion_popup import CompletionPopup
+from .transcription import TranscriptionThread
 
 
 class AudioRecorderApp(QMainWindow, Ui_MainWindow):
@@ -170,7 +168,7 @@ class AudioRecorderApp(QMainWindow, Ui_MainWindow):
             save_path = os.path.join(self.output_path, f"transcricao_completa_{timestamp}.txt")
             try:
                 with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(f"Transcrição Completa - VoxSynopsis\n")
+                    f.write("Transcrição Completa - VoxSynopsis\n")
                     f.write(f"Gerado em: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write("=" * 80 + "\n\n")
                     f.write(full_text)
@@ -201,8 +199,8 @@ class AudioRecorderApp(QMainWindow, Ui_MainWindow):
             print(f"Erro ao exibir popup de conclusão: {e}")
             # Fallback to simple message
             QMessageBox.information(
-                self, 
-                "Transcrição Concluída", 
+                self,
+                "Transcrição Concluída",
                 f"Processamento concluído!\n"
                 f"Arquivos processados: {performance_data.get('successful_files', 0)}/{performance_data.get('total_files', 0)}\n"
                 f"Tempo total: {performance_data.get('total_processing_time', 0):.1f}s"
@@ -336,4 +334,7 @@ class AudioRecorderApp(QMainWindow, Ui_MainWindow):
         if self.recording_thread and self.recording_thread.isRunning():
             self.stop_recording()
             self.recording_thread.wait()
-        a0.accept()
\ No newline at end of file
+        # Imported here: the batch module is only needed to release models at shutdown
+        from .batch_transcription import evict_model_cache
+        evict_model_cache()
+        a0.accept()
@@ -10,6 +10,7 @@ from PyQt5.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QDoubleSpinBox,
+    QFormLayout,
     QFrame,
     QLabel,
     QLineEdit,
@@ -20,7 +21,6 @@ from PyQt5.QtWidgets import (
     QSpinBox,
     QVBoxLayout,
     QWidget,
-    QFormLayout,
 )
 
 try:
@@ -74,10 +74,10 @@ class FastWhisperSettingsDialog(QDialog):
         )
 
         self.device_combo = QComboBox()
-        self.device_combo.addItems(["cpu", "cuda"])
+        self.device_combo.addItems(["auto", "cpu", "cuda"])
         gpu_available = torch is not None and torch.cuda.is_available()
         if not gpu_available:
-            self.device_combo.model().item(1).setEnabled(False)
+            self.device_combo.model().item(2).setEnabled(False)
         self.device_combo.setCurrentText(self.settings.get("device", "cpu"))
         self.form_layout.addRow("Dispositivo:", self.device_combo)
         self.form_layout.addRow(
@@ -87,17 +87,18 @@ class FastWhisperSettingsDialog(QDialog):
         self.compute_type_combo = QComboBox()
         if gpu_available:
             self.compute_type_combo.addItems(
-                ["int8_float16", "float16", "int8", "float32"]
+                ["auto", "int8_float16", "float16", "int8", "float32"]
             )
         else:
-            self.compute_type_combo.addItems(["int8", "float32"])
+            self.compute_type_combo.addItems(["auto", "int8", "float32"])
         self.compute_type_combo.setCurrentText(
-            self.settings.get("compute_type", "int8")
+            self.settings.get("compute_type", "auto")
         )
         self.form_layout.addRow("Tipo de Computação:", self.compute_type_combo)
         self.form_layout.addRow(
             "",
             create_wrapping_label(
+                "'auto' escolhe o tipo mais rápido suportado pelo dispositivo. "
                 "'int8' é o mais rápido (CPU). "
                 "'int8_float16' é o ideal para GPUs (velocidade/precisão)."
             ),
@@ -405,4 +406,4 @@ class FastWhisperSettingsDialog(QDialog):
         self.settings["silence_threshold_dbfs"] = self.silence_threshold_spinbox.value()
         self.settings["min_silence_duration_ms"] = self.min_silence_len_spinbox.value()
         self.settings["cpu_threads"] = self.cpu_threads_spinbox.value()
-        return self.settings
\ No newline at end of file
+        return self.settings
@@ -2,20 +2,23 @@
 
 import concurrent.futures
 import glob
+import logging
 import os
 import re
+import shutil
 import subprocess
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, List
+from typing import Any, Optional
 
 import psutil
-from faster_whisper import WhisperModel
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from .batch_transcription import BatchTranscriptionThread
 from .cache import FileCache
 from .config import MAX_WORKERS
-from .batch_transcription import BatchTranscriptionThread
+
+logger = logging.getLogger(__name__)
 
 
 class TranscriptionThread(QThread):
@@ -68,7 +71,9 @@ class TranscriptionThread(QThread):
     def _check_batch_support(self) -> bool:
         """Check if BatchedInferencePipeline is available and system supports batch processing."""
         try:
-            from faster_whisper import BatchedInferencePipeline
+            import faster_whisper
+            if not hasattr(faster_whisper, "BatchedInferencePipeline"):
+                return False
             # Check minimum memory requirement (8GB for batch processing)
             memory_gb = psutil.virtual_memory().total / (1024**3)
             return memory_gb >= 8
@@ -478,23 +483,24 @@ class TranscriptionThread(QThread):
 
         return final_files
 
-    def _get_files_to_transcribe(self) -> list[str]:
-        """Otimizado com processamento paralelo"""
-        # Limpa cache antigo
-        self.file_cache.clear_stale_entries()
-
-        # 1. Coletar todos os arquivos de mídia (MP4 e WAV)
+    def _collect_media_files(self) -> list[str]:
+        """Lista os arquivos de mídia (MP4 e WAV) da pasta que ainda não foram processados."""
         all_media_files = sorted(
             glob.glob(os.path.join(self.audio_folder, "*.mp4"))
         ) + sorted(glob.glob(os.path.join(self.audio_folder, "*.wav")))
 
         # Filtra arquivos que já são chunks ou processados para evitar reprocessamento
-        all_media_files = [
+        return [
             f for f in all_media_files
             if not any(pattern in os.path.basename(f) for pattern in
                       ["_chunk_", "_processed", "_accelerated", "_extracted"])
         ]
 
+    def _get_files_to_transcribe(self, all_media_files: list[str]) -> list[str]:
+        """Otimizado com processamento paralelo"""
+        # Limpa cache antigo
+        self.file_cache.clear_stale_entries()
+
         # 2. Processa arquivos em paralelo
         files_to_process = self._process_media_files_parallel(all_media_files)
 
@@ -532,13 +538,32 @@ class TranscriptionThread(QThread):
         return sorted(list(set(final_files_for_transcription)))
 
     def run(self):
+        # Imported here so loading the application does not pull in CTranslate2
+        from faster_whisper import WhisperModel
+
         model = None
         last_file_time = 0
         try:
+            # 1. Coletar os arquivos de mídia. Todo o pipeline (extração, divisão,
+            # aceleração) depende do FFmpeg: verifica o PATH uma vez, antes de
+            # carregar o modelo, em vez de falhar em cada subprocesso.
+            all_media_files = self._collect_media_files()
+            if all_media_files and shutil.which("ffmpeg") is None:
+                self.update_status.emit(
+                    {
+                        "text": "Erro: FFmpeg não encontrado. Verifique a instalação.",
+                        "last_time": 0,
+                        "total_time": 0,
+                    }
+                )
+                self.transcription_finished.emit("")
+                return
+
             # Critical settings for WhisperModel initialization
             model_size = self.whisper_settings.pop("model_size", self.whisper_settings.pop("model", "medium"))
             device = self.whisper_settings.pop("device", "cpu")
-            compute_type = self.whisper_settings.pop("compute_type", "int8")
+            # "auto" is resolved by CTranslate2 to the fastest type the device supports
+            compute_type = self.whisper_settings.pop("compute_type", "auto")
 
             # Whitelist de argumentos válidos para o método model.transcribe().
             # Isso evita passar argumentos de palavra-chave inesperados.
@@ -596,10 +621,10 @@ class TranscriptionThread(QThread):
                         compute_type="int8",  # Safe compute type
                         cpu_threads=min(4, self.cpu_threads),  # Conservative thread count
                     )
-                except Exception as e2:
+                except Exception:
                     # Ultimate fallback with minimal configuration
                     self.update_status.emit({
-                        "text": f"Configuração conservadora também falhou, usando configuração mínima...",
+                        "text": "Configuração conservadora também falhou, usando configuração mínima...",
                         "last_time": 0,
                         "total_time": 0,
                     })
@@ -616,7 +641,7 @@ class TranscriptionThread(QThread):
                 }
             )
 
-            files_to_transcribe = self._get_files_to_transcribe()
+            files_to_transcribe = self._get_files_to_transcribe(all_media_files)
 
             if not files_to_transcribe:
                 self.update_status.emit(
@@ -632,7 +657,7 @@ class TranscriptionThread(QThread):
             # Check if we should use batch processing
             total_files = len(files_to_transcribe)
             should_use_batch = (
-                self.use_batch_processing and 
+                self.use_batch_processing and
                 total_files >= self.batch_threshold and
                 hasattr(self, '_check_batch_support') and self._check_batch_support()
             )
@@ -648,6 +673,10 @@ class TranscriptionThread(QThread):
                 # Create batch processing settings
                 batch_settings = self.whisper_settings.copy()
                 batch_settings.update({
+                    # Popped above for the sequential model; the batch thread loads its own
+                    "model_size": model_size,
+                    "device": device,
+                    "compute_type": compute_type,
                     "use_batched_inference": True,
                     "batch_size": self.batch_size,
                     "auto_batch_size": True
@@ -674,9 +703,9 @@ class TranscriptionThread(QThread):
             # Log detailed configuration info
             config_info = [
                 f"\n{'='*60}",
-                f"🚀 INICIAÇÃO DO PROCESSAMENTO SEQUENCIAL",
+                "🚀 INICIAÇÃO DO PROCESSAMENTO SEQUENCIAL",
                 f"{'='*60}",
-                f"⚙️ Configurações do FastWhisper:",
+                "⚙️ Configurações do FastWhisper:",
                 f"   • Modelo: {model_size}",
                 f"   • Dispositivo: {device}",
                 f"   • Tipo de computação: {compute_type}",
@@ -733,7 +762,7 @@ class TranscriptionThread(QThread):
                 )
                 
                 # Salva transcrição individual com nome baseado no arquivo original
-                individual_file = self._save_individual_transcription(filepath, transcription_text)
+                self._save_individual_transcription(filepath, transcription_text)
                 
                 self.update_transcription.emit(transcription_with_metrics)
                 full_transcription.append(
@@ -750,15 +779,15 @@ class TranscriptionThread(QThread):
             # Add detailed processing statistics
             stats_report = [
                 f"\n\n{'='*60}",
-                f"🎯 RELATÓRIO DE PROCESSAMENTO SEQUENCIAL",
+                "🎯 RELATÓRIO DE PROCESSAMENTO SEQUENCIAL",
                 f"{'='*60}",
-                f"📊 Estatísticas de Performance:",
+                "📊 Estatísticas de Performance:",
                 f"   • Total de arquivos processados: {total_files}",
                 f"   • Tempo total de processamento: {total_processing_time:.1f}s ({total_processing_time/60:.1f} min)",
                 f"   • Tempo total decorrido: {total_elapsed_time:.1f}s ({total_elapsed_time/60:.1f} min)",
                 f"   • Tempo médio por arquivo: {total_processing_time/max(1, total_files):.1f}s",
                 f"   • Velocidade de processamento: {total_files/(total_processing_time/60):.1f} arquivos/min",
-                f"\n⚙️ Configurações Utilizadas:",
+                "\n⚙️ Configurações Utilizadas:",
                 f"   • Modelo FastWhisper: {model_size}",
                 f"   • Dispositivo de processamento: {device}",
                 f"   • Tipo de computação: {compute_type}",
@@ -768,7 +797,7 @@ class TranscriptionThread(QThread):
                 f"   • Temperatura: {transcribe_params.get('temperature', 0.0)}",
                 f"   • Beam size: {transcribe_params.get('beam_size', 5)}",
                 f"   • Condição no texto anterior: {'Sim' if transcribe_params.get('condition_on_previous_text', True) else 'Não'}",
-                f"\n💾 Processamento de Arquivos:",
+                "\n💾 Processamento de Arquivos:",
                 f"   • Aceleração aplicada: {self.whisper_settings.get('acceleration_factor', 1.0)}x",
                 f"   • Chunking inteligente: {'Ativo' if self.enable_smart_chunking else 'Inativo'}",
                 f"   • Duração do chunk: {self.smart_chunk_duration_seconds}s",
@@ -802,14 +831,14 @@ class TranscriptionThread(QThread):
             )
             self.transcription_finished.emit("")
 
-    def _cleanup_chunks_and_temp_files(self, directory: str = None):
+    def _cleanup_chunks_and_temp_files(self, directory: Optional[str] = None):
         """Remove chunks e arquivos temporários após processamento."""
         if directory is None:
             directory = self.audio_folder
         
         cleanup_patterns = [
             "*_chunk_*.wav",
-            "*_ffmpeg_chunk_*.wav", 
+            "*_ffmpeg_chunk_*.wav",
             "*_silence_chunk_*.wav",
             "*_accelerated*.wav",
             "*_processed*.wav",
@@ -864,4 +893,4 @@ class TranscriptionThread(QThread):
         # Limpa chunks e arquivos temporários
         self._cleanup_chunks_and_temp_files()
         # Limpa o cache ao parar
-        self.file_cache.clear_stale_entries()
\ No newline at end of file
+        self.file_cache.clear_stale_entries()